@@ -1,5 +1,6 @@
 """Normalize and clean raw shipment records for downstream consumption."""
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -68,7 +69,8 @@ def normalize_shipments(raw_df: pd.DataFrame) -> pd.DataFrame:
         lambda row: classify_shipment_mode(row["weight_kg"], row["is_hazmat"]),
         axis=1,
     )
-    df["status"] = df["status"].apply(normalize_status)
-    df["normalized_at"] = datetime.utcnow()
+    df["status"] = df["status"].apply(normalize_status).astype("category")
+    df["shipping_mode"] = df["shipping_mode"].astype("category")
+    df["normalized_at"] = np.datetime64(datetime.utcnow(), "ns")
 
     return df
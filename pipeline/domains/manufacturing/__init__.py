@@ -1,23 +1,43 @@
 """Manufacturing domain — production tracking, downtime, yield, and scheduling."""
 
+import os
+
 from pipeline.domains.manufacturing.ingest import ingest_production_data
 from pipeline.domains.manufacturing.transform import normalize_production_records
-from pipeline.domains.manufacturing.production import track_production_output
+from pipeline.domains.manufacturing.production import track_production_output, summarize_line_totals
 from pipeline.domains.manufacturing.downtime import analyze_downtime
 from pipeline.domains.manufacturing.yield_analysis import compute_yield_metrics
 from pipeline.domains.manufacturing.scheduling import build_production_schedule
 from pipeline.domains.manufacturing.bom import resolve_bill_of_materials
 from pipeline.domains.manufacturing.efficiency import calculate_oee
-from pipeline.domains.manufacturing.models import ProductionSchema, DowntimeSchema
+from pipeline.domains.manufacturing.models import (
+    ProductionSchema,
+    DowntimeSchema,
+    check_production_records,
+    check_downtime_summary,
+)
+
+# Record types consumed by the analyzers below; quality checks and
+# unclassified records are skipped at scan time.
+ANALYZED_RECORD_TYPES = ["production", "scrap", "downtime", "maintenance"]
 
 
 def validate(df, schema_name: str = "production") -> bool:
-    """Run pandera validation against the given schema."""
+    """Validate manufacturing data against the given schema.
+
+    Runs the vectorized value checks by default; set
+    PIPELINE_STRICT_VALIDATION=1 to run the full pandera schemas instead.
+    """
+    strict = os.environ.get("PIPELINE_STRICT_VALIDATION") == "1"
     match schema_name:
-        case "production":
+        case "production" if strict:
             ProductionSchema.validate(df)
-        case "downtime":
+        case "production":
+            check_production_records(df)
+        case "downtime" if strict:
             DowntimeSchema.validate(df)
+        case "downtime":
+            check_downtime_summary(df)
         case other:
             raise ValueError(f"No schema registered for: {other}")
     return True
@@ -29,15 +49,18 @@ def run(
     include_bom: bool = True,
 ):
     """Execute the full manufacturing pipeline."""
-    raw = ingest_production_data(plants=plants)
+    raw = ingest_production_data(plants=plants, record_types=ANALYZED_RECORD_TYPES)
     cleaned = normalize_production_records(raw, shift=shift)
     validate(cleaned, "production")
 
+    # one totals pass feeds both the yield and OEE analyzers
+    line_totals = summarize_line_totals(cleaned)
+
     output = track_production_output(cleaned)
     downtime = analyze_downtime(cleaned)
-    yields = compute_yield_metrics(cleaned)
+    yields = compute_yield_metrics(cleaned, line_totals=line_totals)
     schedule = build_production_schedule(cleaned, shift=shift)
-    oee = calculate_oee(cleaned)
+    oee = calculate_oee(cleaned, line_totals=line_totals)
 
     results = {
         "production_output": output,
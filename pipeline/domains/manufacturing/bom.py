@@ -6,22 +6,30 @@ from pathlib import Path
 import pandas as pd
 
 from pipeline.config import load_pipeline_config
+from pipeline.utils.io import read_cached
 
 logger = logging.getLogger(__name__)
 
+BOM_COLUMNS = ["parent_id", "component_id", "quantity_per"]
+COST_COLUMNS = ["component_id", "unit_cost"]
+
 
 def _load_bom_master() -> pd.DataFrame:
     """Load the master BOM table from the data warehouse."""
     config = load_pipeline_config()
     bom_path = Path(config.s3.prefix) / "manufacturing" / "bom_master.parquet"
-    return pd.read_parquet(bom_path)
+    return read_cached(bom_path, pd.read_parquet, columns=BOM_COLUMNS)
 
 
 def _load_component_costs() -> pd.DataFrame:
-    """Load current component cost data from procurement feed."""
+    """Load current component cost data from procurement feed.
+
+    The CSV is parsed once per upload; later runs read the local Feather copy
+    kept by `read_cached`, so the shared procurement prefix is never written to.
+    """
     config = load_pipeline_config()
     cost_path = Path(config.s3.prefix) / "procurement" / "component_costs.csv"
-    return pd.read_csv(cost_path)
+    return read_cached(cost_path, pd.read_csv, usecols=COST_COLUMNS)
 
 
 def _explode_bom_tree(bom: pd.DataFrame, product_id: str) -> pd.DataFrame:
@@ -42,7 +50,7 @@ def _explode_bom_tree(bom: pd.DataFrame, product_id: str) -> pd.DataFrame:
 def _rollup_costs(exploded: pd.DataFrame, costs: pd.DataFrame) -> pd.DataFrame:
     """Join component costs and compute the total material cost."""
     merged = exploded.merge(
-        costs[["component_id", "unit_cost"]],
+        costs[COST_COLUMNS],
         on="component_id",
         how="left",
     )
@@ -58,6 +66,14 @@ def resolve_bill_of_materials(df: pd.DataFrame) -> pd.DataFrame:
     """
     bom_master = _load_bom_master()
     costs = _load_component_costs()
+
+    # share one categorical dtype so the per-product cost joins hash integer codes
+    component_ids = pd.CategoricalDtype(
+        pd.Index(bom_master["component_id"].unique()).union(costs["component_id"].unique())
+    )
+    bom_master["component_id"] = bom_master["component_id"].astype(component_ids)
+    costs["component_id"] = costs["component_id"].astype(component_ids)
+
     product_ids = df[df["record_type"] == "production"]["product_id"].unique()
 
     all_boms = pd.DataFrame()
@@ -40,13 +40,13 @@ def _classify_severity(duration_minutes: float) -> str:
             return "critical"
 
 
-def _compute_mtbf(events: pd.DataFrame) -> float:
-    """Mean time between failures for a given set of downtime events."""
-    if len(events) < 2:
-        return float("inf")
-    events = events.sort_values("timestamp")
-    gaps = events["timestamp"].diff().dt.total_seconds() / 3600
-    return gaps.mean()
+def _compute_mtbf(events: pd.DataFrame) -> pd.Series:
+    """Mean time between failures per line, from one sort and a grouped diff."""
+    events = events.sort_values(["line_id", "timestamp"])
+    gaps = events.groupby("line_id", observed=True)["timestamp"].diff().dt.total_seconds() / 3600
+    mtbf = gaps.groupby(events["line_id"], observed=True).mean()
+    # lines with fewer than two events have no gap to average
+    return mtbf.fillna(float("inf"))
 
 
 def analyze_downtime(df: pd.DataFrame) -> pd.DataFrame:
@@ -59,21 +59,16 @@ def analyze_downtime(df: pd.DataFrame) -> pd.DataFrame:
     dt_df["category"] = dt_df["reason"].apply(_categorize_downtime)
     dt_df["severity"] = dt_df["duration_min"].apply(_classify_severity)
 
-    result = pd.DataFrame()
-    for line_id in dt_df["line_id"].unique():
-        line_events = dt_df[dt_df["line_id"] == line_id]
-        summary = (
-            line_events.groupby(["category", "severity"])
-            .agg(
-                event_count=("timestamp", "count"),
-                total_minutes=("duration_min", "sum"),
-                avg_duration=("duration_min", "mean"),
-            )
-            .reset_index()
+    result = (
+        dt_df.groupby(["line_id", "category", "severity"], observed=True)
+        .agg(
+            event_count=("timestamp", "count"),
+            total_minutes=("duration_min", "sum"),
+            avg_duration=("duration_min", "mean"),
         )
-        summary["line_id"] = line_id
-        summary["mtbf_hours"] = _compute_mtbf(line_events)
-        result = result.append(summary, ignore_index=True)
+        .reset_index()
+    )
+    result["mtbf_hours"] = _compute_mtbf(dt_df).reindex(result["line_id"]).to_numpy()
 
     logger.info(f"Analyzed {len(dt_df)} downtime events across {dt_df['line_id'].nunique()} lines")
     return result
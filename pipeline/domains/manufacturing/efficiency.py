@@ -4,8 +4,11 @@ import logging
 import tomllib
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from pipeline.domains.manufacturing.production import summarize_line_totals
+
 logger = logging.getLogger(__name__)
 
 _DEFAULT_TARGETS = {
@@ -32,84 +35,72 @@ def _load_efficiency_targets(config_path: str | None = None) -> dict[str, float]
     return config.get("efficiency_targets", _DEFAULT_TARGETS)
 
 
-def _classify_oee_band(oee_value: float) -> str:
-    """Classify an OEE score into a performance band."""
-    match oee_value:
-        case v if v >= 85:
-            return "world_class"
-        case v if v >= 70:
-            return "good"
-        case v if v >= 55:
-            return "needs_improvement"
-        case v if v >= 40:
-            return "poor"
-        case _:
-            return "critical"
+def _classify_oee_band(oee_value: pd.Series) -> np.ndarray:
+    """Classify OEE scores into performance bands."""
+    return np.select(
+        [oee_value >= 85, oee_value >= 70, oee_value >= 55, oee_value >= 40],
+        ["world_class", "good", "needs_improvement", "poor"],
+        default="critical",
+    )
 
 
-def _availability(planned_min: float, downtime_min: float) -> float:
+def _availability(planned_min: float, downtime_min: pd.Series) -> pd.Series:
     """Availability = (Planned - Downtime) / Planned."""
     if planned_min == 0:
-        return 0.0
+        return pd.Series(0.0, index=downtime_min.index)
     return ((planned_min - downtime_min) / planned_min) * 100
 
 
-def _performance(actual_units: float, ideal_units: float) -> float:
+def _performance(actual_units: pd.Series, ideal_units: float) -> pd.Series:
     """Performance = Actual Output / Ideal Output."""
     if ideal_units == 0:
-        return 0.0
-    return min((actual_units / ideal_units) * 100, 100.0)
+        return pd.Series(0.0, index=actual_units.index)
+    return ((actual_units / ideal_units) * 100).clip(upper=100.0)
 
 
-def _quality(good_units: float, total_units: float) -> float:
+def _quality(good_units: pd.Series, total_units: pd.Series) -> pd.Series:
     """Quality = Good Units / Total Units."""
-    if total_units == 0:
-        return 0.0
-    return (good_units / total_units) * 100
+    return ((good_units / total_units.where(total_units != 0)) * 100).fillna(0.0)
 
 
 def calculate_oee(
     df: pd.DataFrame,
     config_path: str | None = None,
+    line_totals: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     """Compute OEE and sub-metrics per production line.
 
     OEE = Availability x Performance x Quality (each as a fraction).
     Results are tagged with performance bands and compared against
-    configured targets.
+    configured targets. Pass precomputed `line_totals` (see
+    summarize_line_totals) to reuse a totals pass shared with other
+    analyzers.
     """
     targets = _load_efficiency_targets(config_path)
-
-    prod = df[df["record_type"] == "production"]
-    down = df[df["record_type"].isin(["downtime", "maintenance"])]
-    scrap = df[df["record_type"] == "scrap"]
-
-    result = pd.DataFrame()
-    for line_id in df["line_id"].unique():
-        line_prod = prod[prod["line_id"] == line_id]
-        line_down = down[down["line_id"] == line_id]
-        line_scrap = scrap[scrap["line_id"] == line_id]
-
-        total_output = line_prod["quantity_normalized"].sum()
-        scrap_output = line_scrap["quantity_normalized"].sum()
-        downtime_min = line_down["duration_min"].sum() if "duration_min" in line_down.columns else 0
-        planned_min = 1440  # 24h default
-
-        avail = _availability(planned_min, downtime_min)
-        perf = _performance(total_output, planned_min * 2)  # rough ideal rate
-        qual = _quality(total_output - scrap_output, total_output)
-        oee = (avail / 100) * (perf / 100) * (qual / 100) * 100
-
-        row = pd.DataFrame([{
-            "line_id": line_id,
-            "availability_pct": round(avail, 2),
-            "performance_pct": round(perf, 2),
-            "quality_pct": round(qual, 2),
-            "oee_pct": round(oee, 2),
+    if line_totals is None:
+        line_totals = summarize_line_totals(df)
+
+    per_line = line_totals.groupby("line_id", observed=True)[
+        ["total_produced", "total_scrapped", "downtime_min"]
+    ].sum()
+    total_output = per_line["total_produced"]
+    planned_min = 1440  # 24h default
+
+    avail = _availability(planned_min, per_line["downtime_min"])
+    perf = _performance(total_output, planned_min * 2)  # rough ideal rate
+    qual = _quality(total_output - per_line["total_scrapped"], total_output)
+    oee = (avail / 100) * (perf / 100) * (qual / 100) * 100
+
+    result = pd.DataFrame(
+        {
+            "availability_pct": avail.round(2),
+            "performance_pct": perf.round(2),
+            "quality_pct": qual.round(2),
+            "oee_pct": oee.round(2),
             "oee_band": _classify_oee_band(oee),
             "meets_target": oee >= targets.get("oee", 85.0),
-        }])
-        result = result.append(row, ignore_index=True)
+        }
+    ).reset_index()
 
     logger.info(f"OEE calculated for {len(result)} lines")
     return result
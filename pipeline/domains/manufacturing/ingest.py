@@ -1,12 +1,14 @@
 """Ingest production line data from plant-level MES systems and historian feeds."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
 
 from pipeline.config import load_pipeline_config
-from pipeline.utils.io import read_parquet_partitions
+from pipeline.domains.manufacturing.transform import RECORD_TYPE_CODES
+from pipeline.utils.io import read_cached, read_parquet_partitions
 
 logger = logging.getLogger(__name__)
 
@@ -17,64 +19,129 @@ PLANT_FEEDS = {
     "plant-04": "s3://prod-data-pipeline/manufacturing/plant_04/",
 }
 
+MAX_READ_WORKERS = 8
 
-def _read_mes_feed(plant_id: str, base_path: str) -> pd.DataFrame:
+# Only the columns consumed by normalization and the downstream analyzers are
+# read from the parquet feeds; everything else stays on S3. Several of them are
+# optional in older exports, so each list is intersected with the source schema.
+MES_FEED_COLUMNS = [
+    "line_id",
+    "timestamp",
+    "record_code",
+    "quantity",
+    "unit",
+    "product_id",
+    "reason",
+    "duration_min",
+    "cycle_time_sec",
+]
+SCRAP_LOG_COLUMNS = ["plant_id", "line_id", "timestamp", "record_code", "quantity", "unit", "product_id"]
+
+
+def _present_columns(source: str | Path, wanted: list[str]) -> list[str]:
+    """Restrict `wanted` to the columns that exist in the parquet source's schema."""
+    import pyarrow.dataset as ds
+
+    available = set(ds.dataset(str(source), format="parquet").schema.names)
+    return [col for col in wanted if col in available]
+
+
+def _record_code_filter(record_codes: list[str] | None) -> list[tuple] | None:
+    """Build a parquet row filter restricting the scan to the given record codes."""
+    if record_codes is None:
+        return None
+    return [("record_code", "in", record_codes)]
+
+
+def _read_mes_feed(plant_id: str, base_path: str, record_codes: list[str] | None = None) -> pd.DataFrame:
     """Pull daily production feed from a single plant's MES export."""
     logger.info(f"Reading MES feed for {plant_id}")
-    df = pd.read_parquet(base_path)
+    columns = _present_columns(base_path, MES_FEED_COLUMNS)
+    if record_codes is not None and "record_code" not in columns:
+        # every row would normalize to "unknown", which the caller excluded
+        return pd.DataFrame()
+    df = read_cached(
+        base_path,
+        pd.read_parquet,
+        columns=columns,
+        filters=_record_code_filter(record_codes),
+    )
     df["plant_id"] = plant_id
-    df["ingested_at"] = pd.Timestamp.now()
+    df["ingested_at"] = pd.Timestamp.now().to_datetime64()
     return df
 
 
-def _load_manual_overrides(plant_id: str) -> pd.DataFrame:
+def _load_manual_overrides(plant_id: str, record_codes: list[str] | None = None) -> pd.DataFrame:
     """Load any operator-submitted manual corrections for the plant."""
     config = load_pipeline_config()
     override_path = Path(config.s3.prefix) / "overrides" / f"{plant_id}.csv"
     try:
-        return pd.read_csv(override_path)
+        overrides = pd.read_csv(override_path)
     except FileNotFoundError:
         logger.debug(f"No manual overrides for {plant_id}")
         return pd.DataFrame()
+    if record_codes is not None and "record_code" in overrides.columns:
+        overrides = overrides[overrides["record_code"].isin(record_codes)]
+    return overrides
 
 
-def _read_scrap_log(plant_id: str) -> pd.DataFrame:
+def _read_scrap_log(plant_id: str, record_codes: list[str] | None = None) -> pd.DataFrame:
     """Pull scrap/reject log entries for a plant."""
     config = load_pipeline_config()
     scrap_path = Path(config.s3.prefix) / "scrap_logs" / f"{plant_id}.parquet"
     try:
-        return pd.read_parquet(scrap_path)
+        columns = _present_columns(scrap_path, SCRAP_LOG_COLUMNS)
     except FileNotFoundError:
         return pd.DataFrame()
+    if record_codes is not None and "record_code" not in columns:
+        return pd.DataFrame()
+    return pd.read_parquet(scrap_path, columns=columns, filters=_record_code_filter(record_codes))
 
 
 def ingest_production_data(
     plants: list[str] | None = None,
+    record_types: list[str] | None = None,
 ) -> pd.DataFrame:
     """Read and combine production data across plants.
 
     Merges MES feeds, manual overrides, and scrap logs into a single
-    consolidated DataFrame for downstream transformation.
+    consolidated DataFrame for downstream transformation. When
+    `record_types` is given, only rows whose record code maps to one of
+    those types are kept; for the parquet feeds the filter is applied
+    during the scan.
     """
-    targets = plants or list(PLANT_FEEDS.keys())
-    combined = pd.DataFrame()
-
+    record_codes = None
+    if record_types is not None and "unknown" not in record_types:
+        # "unknown" covers missing/unrecognized codes, which cannot be pushed down
+        record_codes = [code for rt in record_types for code in RECORD_TYPE_CODES[rt]]
+
+    # de-duplicate so the same plant's files are never read twice concurrently
+    targets = list(dict.fromkeys(plants)) if plants else list(PLANT_FEEDS.keys())
+    known: list[str] = []
     for plant_id in targets:
         if plant_id not in PLANT_FEEDS:
             logger.error(f"Unknown plant: {plant_id}, skipping")
             continue
-
-        feed = _read_mes_feed(plant_id, PLANT_FEEDS[plant_id])
-
-        overrides = _load_manual_overrides(plant_id)
-        if not overrides.empty:
-            feed = feed.append(overrides, ignore_index=True)
-
-        scrap = _read_scrap_log(plant_id)
-        if not scrap.empty:
-            feed = feed.append(scrap, ignore_index=True)
-
-        combined = combined.append(feed, ignore_index=True)
+        known.append(plant_id)
+
+    frames: list[pd.DataFrame] = []
+    if known:
+        # S3 reads release the GIL, so the feed/override/scrap reads of every
+        # plant are overlapped on a thread pool instead of run back to back.
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(known) * 3)) as executor:
+            pending = [
+                (
+                    executor.submit(_read_mes_feed, plant_id, PLANT_FEEDS[plant_id], record_codes),
+                    executor.submit(_load_manual_overrides, plant_id, record_codes),
+                    executor.submit(_read_scrap_log, plant_id, record_codes),
+                )
+                for plant_id in known
+            ]
+            for plant_futures in pending:
+                frames.extend(f.result() for f in plant_futures)
+
+    frames = [f for f in frames if not f.empty]
+    combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
     if combined.empty:
         raise RuntimeError("No production data ingested — check plant connectivity")
@@ -1,24 +1,26 @@
 """Pandera schemas for manufacturing domain validation."""
 
+import pandas as pd
 import pandera as pa
 from pandera import Column, Check, Index
 
+PRODUCTION_RECORD_TYPES = [
+    "production",
+    "scrap",
+    "downtime",
+    "maintenance",
+    "quality_check",
+    "unknown",
+]
+DOWNTIME_CATEGORIES = ["mechanical", "electrical", "process", "external", "other", "unclassified"]
+DOWNTIME_SEVERITIES = ["micro_stop", "minor", "moderate", "major", "critical"]
+
 ProductionSchema = pa.DataFrameSchema(
     columns={
         "plant_id": Column(str, Check.str_matches(r"^plant-\d{2}$")),
         "line_id": Column(str, nullable=False),
         "timestamp": Column("datetime64[ns, UTC]", nullable=False),
-        "record_type": Column(
-            str,
-            Check.isin([
-                "production",
-                "scrap",
-                "downtime",
-                "maintenance",
-                "quality_check",
-                "unknown",
-            ]),
-        ),
+        "record_type": Column(str, Check.isin(PRODUCTION_RECORD_TYPES)),
         "record_code": Column(str, nullable=True),
         "quantity": Column(float, Check.greater_than_or_equal_to(0)),
         "quantity_normalized": Column(float, Check.greater_than_or_equal_to(0)),
@@ -32,21 +34,8 @@ ProductionSchema = pa.DataFrameSchema(
 DowntimeSchema = pa.DataFrameSchema(
     columns={
         "line_id": Column(str, nullable=False),
-        "category": Column(
-            str,
-            Check.isin([
-                "mechanical",
-                "electrical",
-                "process",
-                "external",
-                "other",
-                "unclassified",
-            ]),
-        ),
-        "severity": Column(
-            str,
-            Check.isin(["micro_stop", "minor", "moderate", "major", "critical"]),
-        ),
+        "category": Column(str, Check.isin(DOWNTIME_CATEGORIES)),
+        "severity": Column(str, Check.isin(DOWNTIME_SEVERITIES)),
         "event_count": Column(int, Check.greater_than(0)),
         "total_minutes": Column(float, Check.greater_than_or_equal_to(0)),
         "avg_duration": Column(float, Check.greater_than_or_equal_to(0)),
@@ -55,3 +44,50 @@ DowntimeSchema = pa.DataFrameSchema(
     coerce=True,
     strict=False,
 )
+
+
+def _raise_on_failures(schema_name: str, failed: dict[str, pd.Series]) -> None:
+    """Raise a ValueError summarizing every column whose failure mask is non-empty."""
+    errors = [f"{col}: {int(mask.sum())} rows failed" for col, mask in failed.items() if mask.any()]
+    if errors:
+        raise ValueError(f"{schema_name} validation failed: {'; '.join(errors)}")
+
+
+def check_production_records(df: pd.DataFrame) -> None:
+    """Vectorized equivalent of the ProductionSchema value checks.
+
+    Each rule is a single boolean mask over its column; dtype coercion is
+    left to the strict pandera path. Like the schema, every declared column
+    must be present, including the nullable ones.
+    """
+    missing = [col for col in ProductionSchema.columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"production validation failed: missing columns {missing}")
+    _raise_on_failures(
+        "production",
+        {
+            "plant_id": ~df["plant_id"].str.match(r"^plant-\d{2}$", na=False),
+            "line_id": df["line_id"].isna(),
+            "timestamp": df["timestamp"].isna(),
+            "record_type": ~df["record_type"].isin(PRODUCTION_RECORD_TYPES),
+            "quantity": ~(df["quantity"] >= 0),
+            "quantity_normalized": ~(df["quantity_normalized"] >= 0),
+            "ingested_at": df["ingested_at"].isna(),
+        },
+    )
+
+
+def check_downtime_summary(df: pd.DataFrame) -> None:
+    """Vectorized equivalent of the DowntimeSchema value checks."""
+    _raise_on_failures(
+        "downtime",
+        {
+            "line_id": df["line_id"].isna(),
+            "category": ~df["category"].isin(DOWNTIME_CATEGORIES),
+            "severity": ~df["severity"].isin(DOWNTIME_SEVERITIES),
+            "event_count": ~(df["event_count"] > 0),
+            "total_minutes": ~(df["total_minutes"] >= 0),
+            "avg_duration": ~(df["avg_duration"] >= 0),
+            "mtbf_hours": ~(df["mtbf_hours"] >= 0),
+        },
+    )
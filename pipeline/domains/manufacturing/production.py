@@ -32,7 +32,7 @@ def _build_shift_summary(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
     df["shift_date"] = df["timestamp"].dt.date
     return (
-        df.groupby(["plant_id", "line_id", "shift_date"])
+        df.groupby(["plant_id", "line_id", "shift_date"], observed=True)
         .agg(
             units_produced=("quantity_normalized", "sum"),
             avg_cycle_time=("cycle_time_sec", "mean"),
@@ -41,6 +41,32 @@ def _build_shift_summary(df: pd.DataFrame) -> pd.DataFrame:
     )
 
 
+def summarize_line_totals(df: pd.DataFrame) -> pd.DataFrame:
+    """Compute per-line output, scrap, and downtime totals in a single groupby pass.
+
+    Shared by the yield and OEE analyzers so the cleaned frame is scanned
+    once instead of being re-filtered per record type and per line.
+    `total_produced` is NaN for lines without any production records.
+    """
+    duration = df["duration_min"] if "duration_min" in df.columns else 0.0
+    by_type = (
+        df.assign(_duration=duration)
+        .groupby(["plant_id", "line_id", "record_type"], observed=True)
+        .agg(quantity=("quantity_normalized", "sum"), duration=("_duration", "sum"))
+        .unstack("record_type")
+    )
+    quantity = by_type["quantity"].reindex(columns=["production", "scrap"])
+    downtime = by_type["duration"].reindex(columns=["downtime", "maintenance"])
+
+    return pd.DataFrame(
+        {
+            "total_produced": quantity["production"],
+            "total_scrapped": quantity["scrap"].fillna(0),
+            "downtime_min": downtime.sum(axis=1),
+        }
+    ).reset_index()
+
+
 def track_production_output(df: pd.DataFrame) -> pd.DataFrame:
     """Build a consolidated view of production output across all lines.
 
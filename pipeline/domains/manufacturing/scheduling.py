@@ -3,6 +3,7 @@
 import logging
 from datetime import date, timedelta
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -38,17 +39,15 @@ def _compute_utilization(scheduled_min: float, shift: str) -> float:
     return min((scheduled_min / capacity) * 100, 100.0)
 
 
-def _validate_schedule_row(row: ScheduleRow) -> str:
-    """Check a single schedule row for common issues."""
-    match (row.get("product_id"), row.get("quantity")):
-        case (None, _):
-            return "missing_product"
-        case (_, None):
-            return "missing_quantity"
-        case (_, qty) if qty <= 0:
-            return "invalid_quantity"
-        case _:
-            return "valid"
+def _validate_schedule(schedule: pd.DataFrame) -> np.ndarray:
+    """Check every schedule row for common issues in a single vectorized pass."""
+    product_id = schedule["product_id"]
+    quantity = schedule["quantity"]
+    return np.select(
+        [product_id.isna(), quantity.isna(), quantity <= 0],
+        ["missing_product", "missing_quantity", "invalid_quantity"],
+        default="valid",
+    )
 
 
 def build_production_schedule(
@@ -68,7 +67,7 @@ def build_production_schedule(
         prod = prod[prod["shift"] == shift]
 
     throughput = (
-        prod.groupby(["plant_id", "line_id", "shift"])
+        prod.groupby(["plant_id", "line_id", "shift"], observed=True)
         .agg(
             avg_output=("quantity_normalized", "mean"),
             run_count=("timestamp", "count"),
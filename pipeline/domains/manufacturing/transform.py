@@ -12,6 +12,18 @@ SHIFT_HOURS = {
     "night": (22, 6),
 }
 
+# Raw MES codes behind each canonical record type (see _classify_record_type).
+RECORD_TYPE_CODES = {
+    "production": ["PR", "PROD"],
+    "scrap": ["SC", "SCRAP", "REJ"],
+    "downtime": ["DT", "DOWN"],
+    "maintenance": ["MT", "MAINT"],
+    "quality_check": ["QC", "QUAL"],
+}
+
+# Low-cardinality keys stored as categoricals so groupbys hash integer codes
+CATEGORICAL_COLUMNS = ("plant_id", "line_id", "record_type", "record_code")
+
 
 def _classify_record_type(row: pd.Series) -> str:
     """Determine the canonical record type from raw MES codes."""
@@ -72,5 +84,9 @@ def normalize_production_records(
         else:
             df = df[(hour >= start_h) | (hour < end_h)]
 
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
     logger.info(f"Normalized {len(df)} production records (shift={shift})")
     return df.reset_index(drop=True)
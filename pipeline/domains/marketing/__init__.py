@@ -11,15 +11,18 @@ from pipeline.domains.marketing.funnel import analyze_conversion_funnel
 from pipeline.domains.marketing.models import CampaignSchema, ChannelSchema
 
 
+SCHEMAS = {
+    "campaign": CampaignSchema,
+    "channel": ChannelSchema,
+}
+
+
 def validate(df, schema_name: str = "campaign") -> bool:
     """Validate marketing data against the appropriate pandera schema."""
-    match schema_name:
-        case "campaign":
-            CampaignSchema.validate(df)
-        case "channel":
-            ChannelSchema.validate(df)
-        case other:
-            raise ValueError(f"No schema registered for: {other}")
+    schema = SCHEMAS.get(schema_name)
+    if schema is None:
+        raise ValueError(f"No schema registered for: {schema_name}")
+    schema.validate(df)
     return True
 
 
@@ -5,50 +5,60 @@ import logging
 import pandas as pd
 import numpy as np
 
+from pipeline.domains.marketing.models import CHANNEL_DTYPE
+
 logger = logging.getLogger(__name__)
 
+NS_PER_DAY = 86_400_000_000_000
+
 
-def _last_click_attribution(touchpoints: pd.DataFrame) -> pd.DataFrame:
-    """Assign 100% credit to the last touchpoint before conversion."""
-    last_touches = (
-        touchpoints.sort_values("timestamp")
-        .groupby("conversion_id")
-        .tail(1)
-        .copy()
-    )
-    last_touches["attribution_credit"] = 1.0
-    last_touches["model"] = "last_click"
-    return last_touches
+def _last_click_attribution(touchpoints: pd.DataFrame, ascending: bool = True) -> pd.DataFrame:
+    """Assign 100% credit to the last touchpoint before conversion.
+
+    The latest touch per journey is found with a grouped max transform in a
+    single linear pass instead of sorting the whole frame by timestamp.
+    With ``ascending=False`` the order is reversed and the earliest touch
+    is credited, which is how first-click is computed.
+    """
+    reducer, keep = ("max", "last") if ascending else ("min", "first")
+    latest = touchpoints.groupby("conversion_id", sort=False)["timestamp"].transform(reducer)
+    last_touches = touchpoints[touchpoints["timestamp"] == latest]
+    last_touches = last_touches[~last_touches["conversion_id"].duplicated(keep=keep)]
+    return last_touches.assign(attribution_credit=1.0, model="last_click")
 
 
 def _linear_attribution(touchpoints: pd.DataFrame) -> pd.DataFrame:
     """Distribute credit equally across all touchpoints in a journey."""
-    result = pd.DataFrame()
-    for conv_id, group in touchpoints.groupby("conversion_id"):
-        n_touches = len(group)
-        chunk = group.copy()
-        chunk["attribution_credit"] = 1.0 / n_touches
-        chunk["model"] = "linear"
-        result = result.append(chunk, ignore_index=True)
+    journey_size = touchpoints.groupby("conversion_id", sort=False)["timestamp"].transform("size")
+    result = touchpoints.copy()
+    result["attribution_credit"] = 1.0 / journey_size
+    result["model"] = "linear"
     return result
 
 
 def _time_decay_attribution(touchpoints: pd.DataFrame, half_life_days: float = 7.0) -> pd.DataFrame:
-    """Weight touchpoints by recency using exponential decay."""
-    attributed = pd.DataFrame()
-
-    for conv_id, journey in touchpoints.groupby("conversion_id"):
-        journey = journey.sort_values("timestamp").copy()
-        conversion_time = journey["timestamp"].max()
-        days_before = (conversion_time - journey["timestamp"]).dt.total_seconds() / 86400
-
-        # exponential decay weights
-        raw_weights = np.exp(-np.log(2) * days_before / half_life_days)
-        total_weight = raw_weights.sum()
-        journey["attribution_credit"] = raw_weights / total_weight if total_weight > 0 else 0
-        journey["model"] = "time_decay"
-        attributed = attributed.append(journey, ignore_index=True)
+    """Weight touchpoints by recency using exponential decay.
 
+    Timestamps are handled as raw int64 nanoseconds so the recency gap is a
+    plain integer subtraction rather than a Timedelta conversion. Missing
+    timestamps are masked out first so NaT's int64 sentinel cannot skew the
+    journey's conversion time.
+    """
+    conversion_ids = touchpoints["conversion_id"]
+    ts_ns = pd.Series(
+        touchpoints["timestamp"].to_numpy("datetime64[ns]").view("int64"),
+        index=touchpoints.index,
+    ).where(touchpoints["timestamp"].notna())
+    conversion_ns = ts_ns.groupby(conversion_ids, sort=False).transform("max")
+    days_before = (conversion_ns - ts_ns) / NS_PER_DAY
+
+    # exponential decay weights, normalized within each journey
+    raw_weights = np.exp(-np.log(2) * days_before / half_life_days)
+    total_weight = raw_weights.groupby(conversion_ids, sort=False).transform("sum")
+
+    attributed = touchpoints.copy()
+    attributed["attribution_credit"] = np.where(total_weight > 0, raw_weights / total_weight, 0.0)
+    attributed["model"] = "time_decay"
     return attributed
 
 
@@ -65,6 +75,12 @@ def compute_attribution(
     if not required_cols.issubset(df.columns):
         raise ValueError(f"Missing columns: {required_cols - set(df.columns)}")
 
+    # group on int codes rather than hashing strings
+    if not isinstance(df["channel"].dtype, pd.CategoricalDtype):
+        df = df.assign(channel=df["channel"].astype(CHANNEL_DTYPE))
+    if not isinstance(df["conversion_id"].dtype, pd.CategoricalDtype):
+        df = df.assign(conversion_id=df["conversion_id"].astype("category"))
+
     match model:
         case "last_click":
             attributed = _last_click_attribution(df)
@@ -74,20 +90,17 @@ def compute_attribution(
             attributed = _time_decay_attribution(df, half_life_days)
         case "first_click":
             # first-click is just last-click on reversed order
-            reversed_df = df.copy()
-            reversed_df["timestamp"] = -reversed_df["timestamp"].astype(int)
-            attributed = _last_click_attribution(reversed_df)
+            attributed = _last_click_attribution(df, ascending=False)
             attributed["model"] = "first_click"
         case unknown:
             raise ValueError(f"Unsupported attribution model: {unknown}")
 
-    # aggregate credited revenue by channel
-    if "revenue" in attributed.columns:
-        attributed["attributed_revenue"] = attributed["revenue"] * attributed["attribution_credit"]
+    # aggregate credited revenue by channel; journeys without revenue credit nothing
+    attributed["attributed_revenue"] = attributed.get("revenue", 0.0) * attributed["attribution_credit"]
 
-    summary = attributed.groupby("channel").agg(
+    summary = attributed.groupby("channel", observed=True).agg(
         total_credit=("attribution_credit", "sum"),
-        attributed_revenue=("attributed_revenue", "sum") if "attributed_revenue" in attributed.columns else ("attribution_credit", "sum"),
+        attributed_revenue=("attributed_revenue", "sum"),
         touchpoints=("conversion_id", "count"),
     ).reset_index()
 
@@ -5,6 +5,8 @@ import logging
 import pandas as pd
 import numpy as np
 
+from pipeline.domains.marketing.models import CHANNEL_DTYPE
+
 logger = logging.getLogger(__name__)
 
 # internal benchmarks by channel (industry averages)
@@ -19,18 +21,8 @@ CHANNEL_BENCHMARKS = {
 }
 
 
-def _benchmark_channel(channel: str, metrics: dict) -> dict:
-    """Compare channel metrics against internal benchmarks."""
-    bench = CHANNEL_BENCHMARKS.get(channel, {})
-    result = {"channel": channel}
-
-    for key, value in metrics.items():
-        result[key] = value
-        if key in bench:
-            result[f"{key}_benchmark"] = bench[key]
-            result[f"{key}_vs_bench"] = (value / bench[key] - 1.0) if bench[key] > 0 else None
-
-    return result
+# metrics compared against CHANNEL_BENCHMARKS in the report
+BENCHMARKED_METRICS = ["ctr", "conv_rate"]
 
 
 def compare_channels(df: pd.DataFrame) -> pd.DataFrame:
@@ -42,7 +34,10 @@ def compare_channels(df: pd.DataFrame) -> pd.DataFrame:
     if "channel" not in df.columns:
         raise ValueError("DataFrame must contain a 'channel' column")
 
-    channel_agg = df.groupby("channel").agg(
+    if not isinstance(df["channel"].dtype, pd.CategoricalDtype):
+        df = df.assign(channel=df["channel"].astype(CHANNEL_DTYPE))
+
+    channel_agg = df.groupby("channel", observed=True).agg(
         impressions=("impressions", "sum"),
         clicks=("clicks", "sum"),
         conversions=("conversions", "sum"),
@@ -68,26 +63,30 @@ def compare_channels(df: pd.DataFrame) -> pd.DataFrame:
         0.0,
     )
 
-    # iterate and benchmark each channel
-    comparison = pd.DataFrame()
-    for col_name, col_data in channel_agg.iteritems():
-        logger.debug("Processing column: %s (dtype=%s)", col_name, col_data.dtype)
-
-    for _, row in channel_agg.iterrows():
-        metrics = {
-            "ctr": row["ctr"],
-            "conv_rate": row["conv_rate"],
-            "cpa": row["cpa"],
-        }
-        benchmarked = _benchmark_channel(row["channel"], metrics)
-        benchmarked["total_spend"] = row["spend"]
-        benchmarked["total_revenue"] = row["revenue"]
-        benchmarked["roas"] = row["revenue"] / row["spend"] if row["spend"] > 0 else 0
-        comparison = comparison.append(benchmarked, ignore_index=True)
+    # join benchmarks once and compute deltas column-wise
+    benchmarks = (
+        pd.DataFrame.from_dict(CHANNEL_BENCHMARKS, orient="index")[BENCHMARKED_METRICS]
+        .add_suffix("_benchmark")
+        .rename_axis("channel")
+        .reset_index()
+    )
+    comparison = (
+        channel_agg[["channel", "ctr", "conv_rate", "cpa", "spend", "revenue"]]
+        .rename(columns={"spend": "total_spend", "revenue": "total_revenue"})
+        .merge(benchmarks, on="channel", how="left")
+    )
+    for metric in BENCHMARKED_METRICS:
+        bench = comparison[f"{metric}_benchmark"]
+        comparison[f"{metric}_vs_bench"] = np.where(bench > 0, comparison[metric] / bench - 1.0, np.nan)
+
+    comparison["roas"] = np.where(
+        comparison["total_spend"] > 0,
+        comparison["total_revenue"] / comparison["total_spend"],
+        0.0,
+    )
 
     # sort by ROAS descending for the final report
-    if "roas" in comparison.columns:
-        comparison = comparison.sort_values("roas", ascending=False).reset_index(drop=True)
+    comparison = comparison.sort_values("roas", ascending=False).reset_index(drop=True)
 
     logger.info("Channel comparison: %d channels benchmarked", len(comparison))
     return comparison
@@ -17,39 +17,19 @@ FUNNEL_STAGES = [
     "purchase",
 ]
 
-
-def _stage_index(stage_name: str) -> int:
-    """Return the ordinal position of a funnel stage."""
-    match stage_name:
-        case "impression":
-            return 0
-        case "click":
-            return 1
-        case "landing_page_view" | "page_view":
-            return 2
-        case "signup" | "registration":
-            return 3
-        case "activation" | "trial_start":
-            return 4
-        case "purchase" | "conversion":
-            return 5
-        case unknown:
-            logger.warning("Unrecognized funnel stage: %s", unknown)
-            return -1
-
-
-def _compute_stage_metrics(stage_df: pd.DataFrame, prev_count: int) -> dict:
-    """Compute drop-off and conversion rate for a single stage."""
-    current_count = len(stage_df)
-    drop_off = prev_count - current_count if prev_count > 0 else 0
-    conv_rate = current_count / prev_count if prev_count > 0 else 0.0
-
-    return {
-        "count": current_count,
-        "drop_off": drop_off,
-        "drop_off_rate": round(1 - conv_rate, 4) if prev_count > 0 else 0,
-        "conversion_rate": round(conv_rate, 4),
-    }
+# Ordinal position of each raw stage name, including known aliases
+STAGE_INDEX = {
+    "impression": 0,
+    "click": 1,
+    "landing_page_view": 2,
+    "page_view": 2,
+    "signup": 3,
+    "registration": 3,
+    "activation": 4,
+    "trial_start": 4,
+    "purchase": 5,
+    "conversion": 5,
+}
 
 
 def analyze_conversion_funnel(
@@ -61,32 +41,39 @@ def analyze_conversion_funnel(
     Each row in the input should represent a user event with a 'stage'
     column and a 'user_id' column.  Optionally filter to a single channel.
     """
-    events = df.copy()
-
-    if channel_filter is not None:
-        events = events[events["channel"] == channel_filter]
+    events = df if channel_filter is None else df[df["channel"] == channel_filter]
 
-    # map stage names to ordinal positions
-    events["stage_idx"] = events["stage"].apply(_stage_index)
-    events = events[events["stage_idx"] >= 0]
+    # map stage names to ordinal positions; works on the two columns needed
+    # rather than a copy of the whole frame
+    stage_idx = events["stage"].map(STAGE_INDEX).fillna(-1).astype("int8")
+    unknown = stage_idx < 0
+    if unknown.any():
+        logger.warning("Dropping %d events with unrecognized funnel stages", unknown.sum())
+    known = ~unknown
 
     # for each user, find the furthest stage they reached
-    user_max_stage = events.groupby("user_id")["stage_idx"].max().reset_index()
-    user_max_stage.columns = ["user_id", "max_stage"]
+    user_max_stage = stage_idx[known].groupby(events.loc[known, "user_id"]).max()
 
     total_users = len(user_max_stage)
-    funnel_report = pd.DataFrame()
-
-    prev_count = total_users
-    for idx, stage_name in enumerate(FUNNEL_STAGES):
-        users_at_stage = user_max_stage[user_max_stage["max_stage"] >= idx]
-        metrics = _compute_stage_metrics(users_at_stage, prev_count)
-        metrics["stage"] = stage_name
-        metrics["stage_index"] = idx
-        metrics["pct_of_total"] = round(metrics["count"] / total_users, 4) if total_users > 0 else 0
 
-        funnel_report = funnel_report.append(metrics, ignore_index=True)
-        prev_count = metrics["count"]
+    # users reaching each stage = users whose furthest stage is at or beyond it
+    furthest = np.bincount(user_max_stage.to_numpy(), minlength=len(FUNNEL_STAGES))
+    at_stage = furthest[::-1].cumsum()[::-1]
+    prev_count = np.r_[total_users, at_stage[:-1]]
+    has_prev = prev_count > 0
+    conv_rate = np.divide(at_stage, prev_count, out=np.zeros(len(at_stage)), where=has_prev)
+
+    funnel_report = pd.DataFrame(
+        {
+            "stage": FUNNEL_STAGES,
+            "stage_index": np.arange(len(FUNNEL_STAGES)),
+            "count": at_stage,
+            "drop_off": np.where(has_prev, prev_count - at_stage, 0),
+            "drop_off_rate": np.where(has_prev, 1 - conv_rate, 0.0).round(4),
+            "conversion_rate": conv_rate.round(4),
+            "pct_of_total": (at_stage / total_users).round(4) if total_users > 0 else 0.0,
+        }
+    )
 
     # overall funnel conversion rate (top to bottom)
     if len(funnel_report) >= 2:
@@ -1,6 +1,7 @@
 """Ingest raw marketing campaign data from multiple ad platforms."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
@@ -15,13 +16,22 @@ PLATFORM_FILES = {
 }
 
 
-def _read_platform_file(platform: str, filename: str, data_dir: Path) -> pd.DataFrame:
-    """Read a single platform export and tag it with the source."""
+def _read_platform_file(
+    platform: str,
+    filename: str,
+    data_dir: Path,
+    cutoff: pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    """Read a single platform export and tag it with the source.
+
+    Rows dated before ``cutoff`` are dropped straight after parsing so the
+    out-of-window history is never tagged, concatenated or deduplicated.
+    """
     filepath = data_dir / filename
     df = pd.read_csv(filepath, parse_dates=["date"])
-    df["source_platform"] = platform
-    df["ingested"] = True
-    return df
+    if cutoff is not None:
+        df = df[df["date"] >= cutoff]
+    return df.assign(source_platform=platform, ingested=True)
 
 
 def ingest_campaign_data(
@@ -31,39 +41,44 @@ def ingest_campaign_data(
 ) -> pd.DataFrame:
     """Load campaign data from all configured ad platforms.
 
-    Reads each platform CSV, tags it, and combines into a single frame.
-    Filters to the requested lookback window.
+    Reads the platform CSVs concurrently, tags each one, and combines them
+    with a single concat.  The lookback window is applied by each reader.
     """
     if data_dir is None:
         data_dir = Path("/data/marketing/raw")
 
-    combined = pd.DataFrame()
-    platforms_to_load = channels or list(PLATFORM_FILES.keys())
-
-    for platform in platforms_to_load:
+    platforms_to_load = []
+    for platform in channels or list(PLATFORM_FILES.keys()):
         if platform not in PLATFORM_FILES:
             logger.warning("Unknown platform %s, skipping", platform)
             continue
+        platforms_to_load.append(platform)
 
-        filename = PLATFORM_FILES[platform]
-        try:
-            chunk = _read_platform_file(platform, filename, data_dir)
-            combined = combined.append(chunk, ignore_index=True)
-            logger.info("Loaded %d rows from %s", len(chunk), platform)
-        except FileNotFoundError:
-            logger.error("Missing export file for %s: %s", platform, filename)
+    cutoff = pd.Timestamp.now() - pd.Timedelta(days=lookback_days)
+    chunks = []
+    if platforms_to_load:
+        with ThreadPoolExecutor(max_workers=len(platforms_to_load)) as pool:
+            futures = {
+                platform: pool.submit(_read_platform_file, platform, PLATFORM_FILES[platform], data_dir, cutoff=cutoff)
+                for platform in platforms_to_load
+            }
+            for platform, future in futures.items():
+                try:
+                    chunk = future.result()
+                except FileNotFoundError:
+                    logger.error("Missing export file for %s: %s", platform, PLATFORM_FILES[platform])
+                    continue
+                chunks.append(chunk)
+                logger.info("Loaded %d rows from %s", len(chunk), platform)
 
-    # apply lookback filter
-    if not combined.empty and "date" in combined.columns:
-        cutoff = pd.Timestamp.now() - pd.Timedelta(days=lookback_days)
-        combined = combined[combined["date"] >= cutoff]
+    combined = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
 
     # deduplicate on campaign_id + date
     if "campaign_id" in combined.columns:
-        before = len(combined)
-        combined = combined.drop_duplicates(subset=["campaign_id", "date"])
-        dupes_removed = before - len(combined)
+        dupes = combined.duplicated(subset=["campaign_id", "date"], keep="first")
+        dupes_removed = int(dupes.sum())
         if dupes_removed:
+            combined = combined[~dupes]
             logger.info("Removed %d duplicate rows", dupes_removed)
 
     return combined.reset_index(drop=True)
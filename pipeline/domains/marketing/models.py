@@ -1,5 +1,6 @@
 """Pandera schemas for validating marketing pipeline data."""
 
+import pandas as pd
 import pandera as pa
 from pandera import Column, Check, Index
 
@@ -9,7 +10,11 @@ VALID_CHANNELS = [
     "referral", "direct", "other",
 ]
 
+# fixed categories so channel groupbys hash int codes instead of strings
+CHANNEL_DTYPE = pd.CategoricalDtype(VALID_CHANNELS)
+
 VALID_TIERS = ["platinum", "gold", "silver", "bronze"]
+TIER_DTYPE = pd.CategoricalDtype(VALID_TIERS)
 
 
 CampaignSchema = pa.DataFrameSchema(
@@ -25,9 +30,9 @@ CampaignSchema = pa.DataFrameSchema(
         "revenue": Column(float, Check.greater_than_or_equal_to(0)),
     },
     checks=[
-        Check(lambda df: (df["clicks"] <= df["impressions"]).all(),
+        Check(lambda df: df["clicks"] <= df["impressions"],
               error="clicks cannot exceed impressions"),
-        Check(lambda df: (df["conversions"] <= df["clicks"]).all(),
+        Check(lambda df: df["conversions"] <= df["clicks"],
               error="conversions cannot exceed clicks"),
     ],
     coerce=True,
@@ -13,33 +13,6 @@ OVERHEAD_MULTIPLIER = 1.15  # 15% overhead for agency fees, tooling, etc.
 DEFAULT_MARGIN = 0.40       # gross margin used to compute profit-based ROI
 
 
-def _compute_period_roi(
-    period_df: pd.DataFrame,
-    margin: float = DEFAULT_MARGIN,
-) -> dict:
-    """Calculate ROI metrics for a single time period."""
-    total_spend = period_df["spend"].sum() * OVERHEAD_MULTIPLIER
-    total_revenue = period_df["revenue"].sum()
-    total_conversions = period_df["conversions"].sum()
-
-    gross_profit = total_revenue * margin
-    net_return = gross_profit - total_spend
-    roi_pct = (net_return / total_spend * 100) if total_spend > 0 else 0
-    roas = total_revenue / total_spend if total_spend > 0 else 0
-    cpa = total_spend / total_conversions if total_conversions > 0 else 0
-
-    return {
-        "total_spend": round(total_spend, 2),
-        "total_revenue": round(total_revenue, 2),
-        "gross_profit": round(gross_profit, 2),
-        "net_return": round(net_return, 2),
-        "roi_pct": round(roi_pct, 2),
-        "roas": round(roas, 2),
-        "cpa": round(cpa, 2),
-        "conversions": int(total_conversions),
-    }
-
-
 def calculate_campaign_roi(
     df: pd.DataFrame,
     group_by: str = "campaign_id",
@@ -47,8 +20,9 @@ def calculate_campaign_roi(
 ) -> pd.DataFrame:
     """Compute ROI breakdown grouped by campaign or channel.
 
-    Supports monthly, weekly, and quarterly rollups.  Appends each
-    group's metrics into a summary DataFrame.
+    Supports monthly, weekly, and quarterly rollups.  Spend, revenue and
+    conversions are summed in a single aggregation and the ROI metrics are
+    derived column-wise from the totals.
     """
     if "date" in df.columns:
         df = df.copy()
@@ -65,19 +39,30 @@ def calculate_campaign_roi(
             case _:
                 df["period"] = "all"
 
-    roi_summary = pd.DataFrame()
-    groups = df.groupby([group_by, "period"]) if "period" in df.columns else df.groupby(group_by)
-
-    for group_key, group_df in groups:
-        metrics = _compute_period_roi(group_df)
+    keys = [group_by, "period"] if "period" in df.columns else [group_by]
+    roi_summary = df.groupby(keys, observed=True).agg(
+        total_spend=("spend", "sum"),
+        total_revenue=("revenue", "sum"),
+        conversions=("conversions", "sum"),
+    ).reset_index()
 
-        if isinstance(group_key, tuple):
-            metrics[group_by] = group_key[0]
-            metrics["period"] = group_key[1]
-        else:
-            metrics[group_by] = group_key
+    total_spend = roi_summary["total_spend"] * OVERHEAD_MULTIPLIER
+    total_revenue = roi_summary["total_revenue"]
+    conversions = roi_summary["conversions"]
+    has_spend = total_spend > 0
 
-        roi_summary = roi_summary.append(metrics, ignore_index=True)
+    gross_profit = total_revenue * DEFAULT_MARGIN
+    net_return = gross_profit - total_spend
+    roi_summary["total_spend"] = total_spend
+    roi_summary["gross_profit"] = gross_profit
+    roi_summary["net_return"] = net_return
+    roi_summary["roi_pct"] = np.where(has_spend, net_return / total_spend.where(has_spend) * 100, 0)
+    roi_summary["roas"] = np.where(has_spend, total_revenue / total_spend.where(has_spend), 0)
+    roi_summary["cpa"] = np.where(conversions > 0, total_spend / conversions.where(conversions > 0), 0)
+
+    rounded = ["total_spend", "total_revenue", "gross_profit", "net_return", "roi_pct", "roas", "cpa"]
+    roi_summary[rounded] = roi_summary[rounded].round(2)
+    roi_summary["conversions"] = conversions.astype(int)
 
     # flag underperforming campaigns
     if "roi_pct" in roi_summary.columns:
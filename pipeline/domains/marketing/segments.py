@@ -16,56 +16,50 @@ type AudienceProfile = dict[str, str | float | int]
 HIGH_ENGAGEMENT_THRESHOLD = 0.75
 MEDIUM_ENGAGEMENT_THRESHOLD = 0.40
 
+ENGAGEMENT_SEGMENTS = pd.CategoricalDtype(["highly_engaged", "moderately_engaged", "low_engagement", "dormant"])
 
-def _compute_engagement_score(row: pd.Series) -> float:
+
+def _compute_engagement_score(df: pd.DataFrame) -> pd.Series:
     """Compute a normalized engagement score from behavioral signals."""
-    email_opens = row.get("email_open_rate", 0)
-    click_rate = row.get("click_rate", 0)
-    sessions = min(row.get("sessions_per_month", 0) / 20, 1.0)
-    recency = max(1.0 - row.get("days_since_last_visit", 365) / 365, 0)
+    email_opens = df.get("email_open_rate", 0)
+    click_rate = df.get("click_rate", 0)
+    sessions = np.minimum(df.get("sessions_per_month", 0) / 20, 1.0)
+    recency = np.maximum(1.0 - df.get("days_since_last_visit", 365) / 365, 0)
 
     return 0.25 * email_opens + 0.30 * click_rate + 0.25 * sessions + 0.20 * recency
 
 
-def _classify_engagement(score: float) -> SegmentLabel:
-    """Classify engagement level using pattern matching on score ranges."""
-    match score:
-        case s if s >= HIGH_ENGAGEMENT_THRESHOLD:
-            return "highly_engaged"
-        case s if s >= MEDIUM_ENGAGEMENT_THRESHOLD:
-            return "moderately_engaged"
-        case s if s > 0.10:
-            return "low_engagement"
-        case _:
-            return "dormant"
+def _classify_engagement(score: pd.Series) -> pd.Categorical:
+    """Classify engagement level from score ranges."""
+    labels = np.select(
+        [score >= HIGH_ENGAGEMENT_THRESHOLD, score >= MEDIUM_ENGAGEMENT_THRESHOLD, score > 0.10],
+        ["highly_engaged", "moderately_engaged", "low_engagement"],
+        default="dormant",
+    )
+    return pd.Categorical(labels, dtype=ENGAGEMENT_SEGMENTS)
 
 
-def _classify_value_tier(ltv: float, avg_order: float) -> SegmentLabel:
+def _classify_value_tier(ltv: pd.Series, avg_order: pd.Series) -> np.ndarray:
     """Classify customer value tier."""
-    match (ltv, avg_order):
-        case (l, a) if l > 5000 and a > 200:
-            return "vip"
-        case (l, a) if l > 1000 and a > 75:
-            return "high_value"
-        case (l, a) if l > 200:
-            return "mid_value"
-        case _:
-            return "low_value"
-
-
-def _classify_lifecycle(days_active: int, purchase_count: int) -> SegmentLabel:
+    return np.select(
+        [(ltv > 5000) & (avg_order > 200), (ltv > 1000) & (avg_order > 75), ltv > 200],
+        ["vip", "high_value", "mid_value"],
+        default="low_value",
+    )
+
+
+def _classify_lifecycle(days_active: pd.Series, purchase_count: pd.Series) -> np.ndarray:
     """Determine lifecycle stage from tenure and purchase history."""
-    match (days_active, purchase_count):
-        case (d, p) if d < 30 and p <= 1:
-            return "new"
-        case (d, p) if d < 90 and p <= 3:
-            return "onboarding"
-        case (d, p) if d >= 90 and p >= 5:
-            return "loyal"
-        case (d, p) if d >= 365 and p < 2:
-            return "at_risk"
-        case _:
-            return "active"
+    return np.select(
+        [
+            (days_active < 30) & (purchase_count <= 1),
+            (days_active < 90) & (purchase_count <= 3),
+            (days_active >= 90) & (purchase_count >= 5),
+            (days_active >= 365) & (purchase_count < 2),
+        ],
+        ["new", "onboarding", "loyal", "at_risk"],
+        default="active",
+    )
 
 
 def build_audience_segments(df: pd.DataFrame) -> pd.DataFrame:
@@ -74,25 +68,24 @@ def build_audience_segments(df: pd.DataFrame) -> pd.DataFrame:
     Expects user-level data with behavioral and transactional columns.
     Returns the original frame augmented with segment labels.
     """
-    result = df.copy()
+    # build only the new label columns and attach them in one concat,
+    # leaving the input's blocks uncopied
+    segments = pd.DataFrame(index=df.index)
 
     # engagement scoring
-    result["engagement_score"] = result.apply(_compute_engagement_score, axis=1)
-    result["engagement_segment"] = result["engagement_score"].apply(_classify_engagement)
+    segments["engagement_score"] = _compute_engagement_score(df)
+    segments["engagement_segment"] = _classify_engagement(segments["engagement_score"])
 
     # value tier
-    if "ltv" in result.columns and "avg_order_value" in result.columns:
-        result["value_tier"] = result.apply(
-            lambda r: _classify_value_tier(r["ltv"], r["avg_order_value"]),
-            axis=1,
-        )
+    if "ltv" in df.columns and "avg_order_value" in df.columns:
+        segments["value_tier"] = _classify_value_tier(df["ltv"], df["avg_order_value"])
 
     # lifecycle stage
-    if "days_active" in result.columns and "purchase_count" in result.columns:
-        result["lifecycle_stage"] = result.apply(
-            lambda r: _classify_lifecycle(int(r["days_active"]), int(r["purchase_count"])),
-            axis=1,
-        )
+    if "days_active" in df.columns and "purchase_count" in df.columns:
+        segments["lifecycle_stage"] = _classify_lifecycle(df["days_active"], df["purchase_count"])
+
+    base = df.drop(columns=segments.columns.intersection(df.columns))
+    result = pd.concat([base, segments], axis=1, copy=False)
 
     segment_counts = result["engagement_segment"].value_counts().to_dict()
     logger.info("Audience segments: %s", segment_counts)
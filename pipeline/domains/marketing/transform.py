@@ -3,6 +3,8 @@
 import pandas as pd
 import numpy as np
 
+from pipeline.domains.marketing.models import CHANNEL_DTYPE
+
 # Standard channel taxonomy used across the org
 CHANNEL_TAXONOMY = {
     "cpc": "paid_search",
@@ -19,29 +21,35 @@ CHANNEL_TAXONOMY = {
 }
 
 
-def _classify_channel(raw_channel: str) -> str:
-    """Map a raw channel string to the standard taxonomy using pattern matching."""
-    normalized = raw_channel.strip().lower().replace(" ", "_")
-
-    match normalized:
-        case "google_cpc" | "bing_cpc" | "cpc" | "ppc" | "sem":
-            return "paid_search"
-        case "facebook_ads" | "instagram_ads" | "social_paid" | "tiktok_ads":
-            return "paid_social"
-        case "facebook_organic" | "instagram_organic" | "social_organic":
-            return "organic_social"
-        case "display" | "programmatic" | "gdn" | "banner":
-            return "display"
-        case "email_blast" | "email_drip" | "email" | "newsletter":
-            return "email"
-        case "seo" | "organic" | "organic_search":
-            return "organic_search"
-        case "affiliate" | "partner":
-            return "affiliate"
-        case "referral":
-            return "referral"
-        case _:
-            return "other"
+# Raw channel spellings (after strip/lower/underscore) mapped to the taxonomy;
+# anything not listed is classified as "other"
+CHANNEL_ALIASES = {
+    **dict.fromkeys(["google_cpc", "bing_cpc", "cpc", "ppc", "sem"], "paid_search"),
+    **dict.fromkeys(["facebook_ads", "instagram_ads", "social_paid", "tiktok_ads"], "paid_social"),
+    **dict.fromkeys(["facebook_organic", "instagram_organic", "social_organic"], "organic_social"),
+    **dict.fromkeys(["display", "programmatic", "gdn", "banner"], "display"),
+    **dict.fromkeys(["email_blast", "email_drip", "email", "newsletter"], "email"),
+    **dict.fromkeys(["seo", "organic", "organic_search"], "organic_search"),
+    **dict.fromkeys(["affiliate", "partner"], "affiliate"),
+    "referral": "referral",
+}
+
+
+def _classify_channel(raw_channel: pd.Series) -> pd.Series:
+    """Map raw channel strings to the standard taxonomy.
+
+    Only the distinct raw spellings are normalized and looked up; every row
+    is then resolved with an integer take from its factorized code.
+    """
+    codes, uniques = pd.factorize(raw_channel, sort=False)
+    normalized = pd.Series(uniques).str.strip().str.lower().str.replace(" ", "_", regex=False)
+    labels = normalized.map(CHANNEL_ALIASES).fillna("other")
+
+    # trailing slot catches missing values (factorize code -1)
+    categories = CHANNEL_DTYPE.categories
+    table = np.append(categories.get_indexer(labels), categories.get_loc("other"))
+    channel = pd.Categorical.from_codes(table[codes], dtype=CHANNEL_DTYPE)
+    return pd.Series(channel, index=raw_channel.index)
 
 
 def _clean_currency_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -49,9 +57,7 @@ def _clean_currency_columns(df: pd.DataFrame) -> pd.DataFrame:
     currency_cols = [c for c in df.columns if "spend" in c or "revenue" in c or "cost" in c]
     for col in currency_cols:
         if df[col].dtype == object:
-            df[col] = df[col].str.replace("$", "", regex=False)
-            df[col] = df[col].str.replace(",", "", regex=False)
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+            df[col] = pd.to_numeric(df[col].str.replace(r"[$,]", "", regex=True), errors="coerce")
     return df
 
 
@@ -61,12 +67,14 @@ def normalize_campaigns(raw_df: pd.DataFrame) -> pd.DataFrame:
     Standardizes channel names, cleans currency fields, fills nulls,
     and computes derived metrics like CTR and CPC.
     """
-    df = raw_df.copy()
+    # shallow copy: every column below is either new or replaced wholesale,
+    # so untouched raw columns can keep sharing their buffers
+    df = raw_df.copy(deep=False)
 
     # standardize channel taxonomy
     if "channel" in df.columns:
         df["channel_raw"] = df["channel"]
-        df["channel"] = df["channel"].apply(_classify_channel)
+        df["channel"] = _classify_channel(df["channel"])
 
     df = _clean_currency_columns(df)
 
@@ -75,19 +83,23 @@ def normalize_campaigns(raw_df: pd.DataFrame) -> pd.DataFrame:
         if metric_col in df.columns:
             df[metric_col] = df[metric_col].fillna(0).astype(int)
 
-    # derived metrics
+    # derived metrics; zero denominators are skipped and left at 0.0
     if "clicks" in df.columns and "impressions" in df.columns:
-        df["ctr"] = np.where(
-            df["impressions"] > 0,
-            df["clicks"] / df["impressions"],
-            0.0,
+        impressions = df["impressions"].to_numpy(dtype=np.float64)
+        df["ctr"] = np.divide(
+            df["clicks"].to_numpy(dtype=np.float64),
+            impressions,
+            out=np.zeros(len(df)),
+            where=impressions > 0,
         )
 
     if "spend" in df.columns and "clicks" in df.columns:
-        df["cost_per_click"] = np.where(
-            df["clicks"] > 0,
-            df["spend"] / df["clicks"],
-            0.0,
+        clicks = df["clicks"].to_numpy(dtype=np.float64)
+        df["cost_per_click"] = np.divide(
+            df["spend"].to_numpy(dtype=np.float64),
+            clicks,
+            out=np.zeros(len(df)),
+            where=clicks > 0,
         )
 
     return df
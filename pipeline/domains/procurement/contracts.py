@@ -1,9 +1,9 @@
 """Contract management — renewal tracking, compliance, and term analysis."""
 
 from dataclasses import dataclass
-from datetime import date
 
 import pandas as pd
+import numpy as np
 from rich.console import Console
 
 type ContractFrame = pd.DataFrame
@@ -20,42 +20,44 @@ class ContractPolicy:
     minimum_competition_threshold: float = 25_000.0
 
 
-def _classify_contract_type(row: pd.Series) -> str:
+DEFAULT_CONTRACT_POLICY = ContractPolicy()
+
+
+def _classify_contract_type(df: pd.DataFrame) -> pd.Categorical:
     """Determine contract classification from metadata fields."""
-    term_months = row.get("term_months", 0)
-    total_value = row.get("total_value", 0)
-    vendor_count = row.get("awarded_vendors", 1)
-
-    match (term_months, total_value, vendor_count):
-        case (t, _, _) if t <= 0:
-            return "spot_purchase"
-        case (t, v, _) if t <= 12 and v < 10_000:
-            return "blanket_order"
-        case (_, v, n) if v > 500_000 and n > 1:
-            return "master_agreement"
-        case (_, v, _) if v > 100_000:
-            return "strategic_contract"
-        case (t, _, _) if t > 36:
-            return "long_term_agreement"
-        case _:
-            return "standard_contract"
-
-
-def _check_renewal_status(expiry_date: date, policy: ContractPolicy) -> str:
+    term_months = df["term_months"]
+    total_value = df.get("total_value", 0)
+    vendor_count = df.get("awarded_vendors", 1)
+
+    contract_type = np.select(
+        [
+            term_months <= 0,
+            (term_months <= 12) & (total_value < 10_000),
+            (total_value > 500_000) & (vendor_count > 1),
+            total_value > 100_000,
+            term_months > 36,
+        ],
+        ["spot_purchase", "blanket_order", "master_agreement", "strategic_contract", "long_term_agreement"],
+        default="standard_contract",
+    )
+    return pd.Categorical(contract_type)
+
+
+def _check_renewal_status(expiry_date: pd.Series, policy: ContractPolicy) -> pd.Categorical:
     """Evaluate contract renewal urgency."""
-    days_remaining = (expiry_date - date.today()).days
+    days_remaining = (expiry_date - pd.Timestamp.today().normalize()).dt.days
 
-    match days_remaining:
-        case d if d < 0:
-            return "expired"
-        case d if d <= 30:
-            return "critical_renewal"
-        case d if d <= policy.review_before_days:
-            return "upcoming_renewal"
-        case d if d <= policy.auto_renew_limit_days:
-            return "review_recommended"
-        case _:
-            return "active"
+    status = np.select(
+        [
+            days_remaining < 0,
+            days_remaining <= 30,
+            days_remaining <= policy.review_before_days,
+            days_remaining <= policy.auto_renew_limit_days,
+        ],
+        ["expired", "critical_renewal", "upcoming_renewal", "review_recommended"],
+        default="active",
+    )
+    return pd.Categorical(status)
 
 
 def _analyze_term_distribution(df: ContractFrame) -> pd.DataFrame:
@@ -71,22 +73,25 @@ def _analyze_term_distribution(df: ContractFrame) -> pd.DataFrame:
     ).reset_index().round(2)
 
 
-def evaluate_contracts(df: pd.DataFrame) -> ContractMetrics:
+def evaluate_contracts(
+    df: pd.DataFrame,
+    policy: ContractPolicy = DEFAULT_CONTRACT_POLICY,
+) -> ContractMetrics:
     """Evaluate contract portfolio for renewals, compliance, and term distribution."""
     console.print("  Evaluating contract portfolio...")
-    policy = ContractPolicy()
 
     if "term_months" in df.columns:
-        df["contract_type"] = df.apply(_classify_contract_type, axis=1)
+        df["contract_type"] = _classify_contract_type(df)
 
     if "expiry_date" in df.columns:
-        df["expiry_date"] = pd.to_datetime(df["expiry_date"]).dt.date
-        df["renewal_status"] = df["expiry_date"].apply(
-            lambda d: _check_renewal_status(d, policy)
-        )
+        df["expiry_date"] = pd.to_datetime(df["expiry_date"])
+        df["renewal_status"] = _check_renewal_status(df["expiry_date"], policy)
 
     term_dist = _analyze_term_distribution(df)
-    critical = df[df.get("renewal_status", pd.Series(dtype=str)) == "critical_renewal"]
+    if "renewal_status" in df.columns:
+        critical = df[df["renewal_status"] == "critical_renewal"]
+    else:
+        critical = df.iloc[0:0]
 
     console.print(f"  {len(critical)} contracts need critical renewal attention")
     return {
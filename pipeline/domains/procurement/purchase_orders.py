@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 
 import pandas as pd
+import numpy as np
 from rich.console import Console
 
 type POFrame = pd.DataFrame
@@ -19,7 +20,7 @@ PO_STATUS_WEIGHTS = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class POThresholds:
     aging_warning_days: int = 30
     aging_critical_days: int = 60
@@ -27,60 +28,60 @@ class POThresholds:
     approval_required_above: float = 10_000.0
 
 
-def _compute_aging_buckets(df: pd.DataFrame) -> pd.DataFrame:
+DEFAULT_PO_THRESHOLDS = POThresholds()
+
+
+def _compute_aging_buckets(
+    df: pd.DataFrame,
+    thresholds: POThresholds = DEFAULT_PO_THRESHOLDS,
+) -> pd.DataFrame:
     """Assign each open PO to an aging bucket."""
-    today = pd.Timestamp.now()
-    buckets = pd.DataFrame()
-    thresholds = POThresholds()
-
-    for _, row in df.iterrows():
-        age_days = (today - row["po_date"]).days
-        match age_days:
-            case d if d <= 7:
-                bucket = "current"
-            case d if d <= thresholds.aging_warning_days:
-                bucket = "30_day"
-            case d if d <= thresholds.aging_critical_days:
-                bucket = "60_day"
-            case _:
-                bucket = "90_plus"
-
-        entry = pd.DataFrame([{
-            "po_number": row["po_number"],
-            "age_days": age_days,
-            "bucket": bucket,
-            "amount": row.get("amount_clean", 0),
-        }])
-        buckets = buckets.append(entry, ignore_index=True)
-
-    return buckets
-
-
-def _flag_compliance_issues(df: pd.DataFrame) -> pd.DataFrame:
+    age_days = (pd.Timestamp.now() - df["po_date"]).dt.days
+
+    bucket = pd.cut(
+        age_days,
+        bins=[-np.inf, 7, thresholds.aging_warning_days, thresholds.aging_critical_days, np.inf],
+        labels=["current", "30_day", "60_day", "90_plus"],
+    ).fillna("90_plus")
+
+    return pd.DataFrame({
+        "po_number": df["po_number"].to_numpy(),
+        "age_days": age_days.to_numpy(),
+        "bucket": bucket.to_numpy(),
+        "amount": df["amount_clean"].to_numpy() if "amount_clean" in df.columns else 0,
+    })
+
+
+def _is_blank(df: pd.DataFrame, column: str) -> pd.Series:
+    """True where a column is missing, null, or an empty string."""
+    if column not in df.columns:
+        return pd.Series(True, index=df.index)
+    return df[column].isna() | (df[column] == "")
+
+
+def _flag_compliance_issues(
+    df: pd.DataFrame,
+    thresholds: POThresholds = DEFAULT_PO_THRESHOLDS,
+) -> pd.DataFrame:
     """Flag POs that violate procurement policy."""
-    thresholds = POThresholds()
-    issues = pd.DataFrame()
-
-    for _, row in df.iterrows():
-        flags = []
-        amount = row.get("amount_clean", 0)
-
-        if amount > thresholds.max_line_amount:
-            flags.append("exceeds_line_limit")
-        if amount > thresholds.approval_required_above and not row.get("approved_by"):
-            flags.append("missing_approval")
-        if not row.get("vendor_id"):
-            flags.append("no_vendor")
-
-        if flags:
-            issue = pd.DataFrame([{
-                "po_number": row["po_number"],
-                "flags": "|".join(flags),
-                "amount": amount,
-            }])
-            issues = issues.append(issue, ignore_index=True)
-
-    return issues
+    amount = df["amount_clean"] if "amount_clean" in df.columns else pd.Series(0, index=df.index)
+
+    checks = {
+        "exceeds_line_limit": amount > thresholds.max_line_amount,
+        "missing_approval": (amount > thresholds.approval_required_above) & _is_blank(df, "approved_by"),
+        "no_vendor": _is_blank(df, "vendor_id"),
+    }
+
+    flags = pd.Series("", index=df.index)
+    for name, mask in checks.items():
+        flags = flags + np.where(mask, f"{name}|", "")
+
+    any_flag = flags != ""
+    return pd.DataFrame({
+        "po_number": df.loc[any_flag, "po_number"].to_numpy(),
+        "flags": flags[any_flag].str.rstrip("|").to_numpy(),
+        "amount": amount[any_flag].to_numpy(),
+    })
 
 
 def analyze_purchase_orders(df: pd.DataFrame) -> POSummary:
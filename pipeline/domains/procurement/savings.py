@@ -1,6 +1,7 @@
 """Cost savings tracking — negotiated discounts, consolidation, and avoidance."""
 
 import pandas as pd
+import numpy as np
 from rich.console import Console
 
 console = Console()
@@ -20,23 +21,21 @@ def _calculate_negotiated_savings(df: pd.DataFrame) -> pd.DataFrame:
     if not {"quoted_amount", "amount_clean"}.issubset(df.columns):
         return pd.DataFrame()
 
-    savings = pd.DataFrame()
-    for _, row in df.iterrows():
-        quoted = row["quoted_amount"]
-        actual = row["amount_clean"]
-        if quoted > 0 and actual < quoted:
-            entry = pd.DataFrame([{
-                "po_number": row["po_number"],
-                "vendor_id": row.get("vendor_id", "unknown"),
-                "quoted_amount": quoted,
-                "actual_amount": actual,
-                "savings_amount": round(quoted - actual, 2),
-                "savings_pct": round((1 - actual / quoted) * 100, 2),
-                "savings_type": "negotiated_discount",
-            }])
-            savings = savings.append(entry, ignore_index=True)
+    quoted = df["quoted_amount"]
+    actual = df["amount_clean"]
+    realized = df[(quoted > 0) & (actual < quoted)]
+    quoted = realized["quoted_amount"]
+    actual = realized["amount_clean"]
 
-    return savings
+    return pd.DataFrame({
+        "po_number": realized["po_number"],
+        "vendor_id": realized["vendor_id"] if "vendor_id" in realized.columns else "unknown",
+        "quoted_amount": quoted,
+        "actual_amount": actual,
+        "savings_amount": (quoted - actual).round(2),
+        "savings_pct": ((1 - actual / quoted) * 100).round(2),
+        "savings_type": "negotiated_discount",
+    }).reset_index(drop=True)
 
 
 def _calculate_consolidation_savings(df: pd.DataFrame) -> pd.DataFrame:
@@ -44,25 +43,26 @@ def _calculate_consolidation_savings(df: pd.DataFrame) -> pd.DataFrame:
     if "vendor_id" not in df.columns or "category_normalized" not in df.columns:
         return pd.DataFrame()
 
-    savings = pd.DataFrame()
-    for category, group in df.groupby("category_normalized"):
-        vendor_count = group["vendor_id"].nunique()
-        total_spend = group["amount_clean"].sum() if "amount_clean" in group.columns else 0
-
-        # Estimate 3-8% savings potential for categories with many vendors
-        if vendor_count > 3 and total_spend > 10_000:
-            savings_pct = min(0.08, 0.02 * (vendor_count - 2))
-            row = pd.DataFrame([{
-                "category": category,
-                "vendor_count": vendor_count,
-                "total_spend": round(total_spend, 2),
-                "estimated_savings": round(total_spend * savings_pct, 2),
-                "savings_pct": round(savings_pct * 100, 2),
-                "savings_type": "volume_consolidation",
-            }])
-            savings = savings.append(row, ignore_index=True)
+    if "amount_clean" not in df.columns:
+        # without spend no category can clear the 10k threshold
+        return pd.DataFrame()
 
-    return savings
+    totals = df.groupby("category_normalized", observed=True).agg(
+        vendor_count=("vendor_id", "nunique"),
+        total_spend=("amount_clean", "sum"),
+    )
+    candidates = totals[(totals["vendor_count"] > 3) & (totals["total_spend"] > 10_000)]
+
+    # Estimate 3-8% savings potential for categories with many vendors
+    savings_pct = np.minimum(0.08, 0.02 * (candidates["vendor_count"] - 2))
+    return pd.DataFrame({
+        "category": candidates.index,
+        "vendor_count": candidates["vendor_count"].to_numpy(),
+        "total_spend": candidates["total_spend"].round(2).to_numpy(),
+        "estimated_savings": (candidates["total_spend"] * savings_pct).round(2).to_numpy(),
+        "savings_pct": (savings_pct * 100).round(2).to_numpy(),
+        "savings_type": "volume_consolidation",
+    })
 
 
 def _calculate_vendor_switch_savings(
@@ -73,26 +73,18 @@ def _calculate_vendor_switch_savings(
     if vendor_scores.empty or "vendor_id" not in df.columns:
         return pd.DataFrame()
 
-    low_tier = vendor_scores[vendor_scores["tier"].isin(["probation", "blocked"])]
-    savings = pd.DataFrame()
-
-    for _, vendor in low_tier.iterrows():
-        vendor_spend = df[df["vendor_id"] == vendor["vendor_id"]]
-        if vendor_spend.empty:
-            continue
-
-        total = vendor_spend["amount_clean"].sum() if "amount_clean" in vendor_spend.columns else 0
-        estimated = total * 0.05  # assume 5% savings from switching
+    low_tier = vendor_scores.loc[
+        vendor_scores["tier"].isin(["probation", "blocked"]), ["vendor_id", "tier"]
+    ].rename(columns={"tier": "current_tier"})
 
-        entry = pd.DataFrame([{
-            "vendor_id": vendor["vendor_id"],
-            "current_tier": vendor["tier"],
-            "total_spend": round(total, 2),
-            "estimated_savings": round(estimated, 2),
-            "savings_type": "vendor_switch",
-        }])
-        savings = savings.append(entry, ignore_index=True)
+    amount = df["amount_clean"] if "amount_clean" in df.columns else 0
+    spend = pd.DataFrame({"vendor_id": df["vendor_id"], "total_spend": amount})
+    joined = spend.merge(low_tier, on="vendor_id", how="inner")
 
+    savings = joined.groupby(["vendor_id", "current_tier"], as_index=False, observed=True)["total_spend"].sum()
+    savings["estimated_savings"] = (savings["total_spend"] * 0.05).round(2)  # assume 5% savings from switching
+    savings["total_spend"] = savings["total_spend"].round(2)
+    savings["savings_type"] = "vendor_switch"
     return savings
 
 
@@ -21,23 +21,24 @@ def _build_category_summary(df: pd.DataFrame) -> pd.DataFrame:
     if "category_normalized" not in df.columns or "amount_clean" not in df.columns:
         return pd.DataFrame()
 
-    summary = pd.DataFrame()
-    grouped = df.groupby("category_normalized")["amount_clean"]
-
-    for category, amounts in grouped:
-        total = amounts.sum()
-        threshold = SPEND_THRESHOLDS.get(category, 250_000)
-        row = pd.DataFrame([{
-            "category": category,
-            "total_spend": round(total, 2),
-            "transaction_count": len(amounts),
-            "avg_transaction": round(total / len(amounts), 2),
-            "budget_threshold": threshold,
-            "over_budget": total > threshold,
-            "utilization_pct": round((total / threshold) * 100, 1),
-        }])
-        summary = summary.append(row, ignore_index=True)
-
+    totals = df.groupby("category_normalized", observed=True)["amount_clean"].agg(
+        total_spend="sum",
+        transaction_count="size",
+    )
+    total = totals["total_spend"].to_numpy()
+    count = totals["transaction_count"].to_numpy()
+    categories = totals.index.astype(object)
+    threshold = categories.map(SPEND_THRESHOLDS).fillna(250_000).astype("int64").to_numpy()
+
+    summary = pd.DataFrame({
+        "category": categories,
+        "total_spend": total.round(2),
+        "transaction_count": count,
+        "avg_transaction": (total / count).round(2),
+        "budget_threshold": threshold,
+        "over_budget": total > threshold,
+        "utilization_pct": (total / threshold * 100).round(1),
+    })
     return summary.sort_values("total_spend", ascending=False)
 
 
@@ -52,10 +53,9 @@ def _compute_department_breakdown(df: pd.DataFrame) -> pd.DataFrame:
         avg_amount=("amount_clean", "mean"),
     ).reset_index()
 
-    # Iterate over columns to apply formatting rules
-    for col_name, col_data in dept_spend.iteritems():
-        if col_data.dtype == "float64":
-            dept_spend[col_name] = col_data.round(2)
+    # Round every float column in one pass
+    float_cols = dept_spend.select_dtypes(include="float64").columns
+    dept_spend[float_cols] = dept_spend[float_cols].round(2)
 
     return dept_spend
 
@@ -65,22 +65,13 @@ def _identify_tail_spend(df: pd.DataFrame, threshold_pct: float = 0.80) -> pd.Da
     if "vendor_id" not in df.columns:
         return pd.DataFrame()
 
-    vendor_totals = df.groupby("vendor_id")["amount_clean"].sum().sort_values(ascending=False)
-    cumulative = vendor_totals.cumsum() / vendor_totals.sum()
-
-    tail_vendors = cumulative[cumulative > threshold_pct].index
-    tail_df = pd.DataFrame()
-
-    for vid in tail_vendors:
-        vendor_data = df[df["vendor_id"] == vid]
-        row = pd.DataFrame([{
-            "vendor_id": vid,
-            "total_spend": vendor_data["amount_clean"].sum(),
-            "transaction_count": len(vendor_data),
-        }])
-        tail_df = tail_df.append(row, ignore_index=True)
+    vendor_totals = df.groupby("vendor_id", observed=True)["amount_clean"].agg(
+        total_spend="sum",
+        transaction_count="size",
+    ).sort_values("total_spend", ascending=False)
+    cumulative = vendor_totals["total_spend"].cumsum() / vendor_totals["total_spend"].sum()
 
-    return tail_df
+    return vendor_totals[cumulative > threshold_pct].reset_index()
 
 
 def build_spend_analysis(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
@@ -91,11 +82,11 @@ def build_spend_analysis(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
     dept_breakdown = _compute_department_breakdown(df)
     tail_spend = _identify_tail_spend(df)
 
-    # Log column-level stats via iteritems for monitoring
+    # Log column-level stats for monitoring
     if not category_summary.empty:
-        for col_name, col_data in category_summary.iteritems():
-            if col_data.dtype in ("float64", "int64"):
-                console.print(f"    {col_name}: mean={col_data.mean():.2f}")
+        means = category_summary.select_dtypes(include=["float64", "int64"]).mean()
+        for col_name, mean in means.items():
+            console.print(f"    {col_name}: mean={mean:.2f}")
 
     console.print(f"  Spend analysis complete: {len(category_summary)} categories")
     return {
@@ -1,6 +1,7 @@
 """Normalize and clean procurement records for downstream analysis."""
 
 import pandas as pd
+import numpy as np
 from rich.console import Console
 
 console = Console()
@@ -21,45 +22,44 @@ CATEGORY_MAP = {
     "LOGISTICS": "logistics",
 }
 
+EUR_TO_USD = 1.08
 
-def _normalize_category(raw_category: str) -> str:
+# Low-cardinality keys stored as categoricals so groupby/isin work on integer codes
+CATEGORICAL_COLUMNS = ("status", "approval_status", "category_normalized", "urgency", "vendor_id", "approver_id")
+
+
+def _normalize_category(raw_category: pd.Series) -> pd.Series:
     """Map raw procurement category codes to standard names."""
-    upper = raw_category.strip().upper()
-    return CATEGORY_MAP.get(upper, raw_category.lower())
+    upper = raw_category.str.strip().str.upper()
+    return upper.map(CATEGORY_MAP).fillna(raw_category.str.lower())
 
 
-def _classify_urgency(row: pd.Series) -> str:
+def _classify_urgency(df: pd.DataFrame) -> np.ndarray:
     """Determine urgency tier from PO metadata."""
-    days_to_delivery = (row.get("delivery_date") - row.get("po_date")).days
-
-    match days_to_delivery:
-        case d if d < 0:
-            return "overdue"
-        case 0 | 1:
-            return "emergency"
-        case d if d <= 3:
-            return "urgent"
-        case d if d <= 7:
-            return "standard"
-        case d if d <= 30:
-            return "planned"
-        case _:
-            return "long_lead"
-
-
-def _clean_currency(amount_str: str | float) -> float:
-    """Strip currency symbols and convert to float."""
-    match amount_str:
-        case float() | int():
-            return float(amount_str)
-        case str() if amount_str.startswith("$"):
-            return float(amount_str.replace("$", "").replace(",", ""))
-        case str() if amount_str.startswith("€"):
-            return float(amount_str.replace("€", "").replace(",", "")) * 1.08
-        case str():
-            return float(amount_str.replace(",", ""))
-        case _:
-            return 0.0
+    days_to_delivery = (df["delivery_date"] - df["po_date"]).dt.days
+
+    return np.select(
+        [
+            days_to_delivery < 0,
+            days_to_delivery <= 1,
+            days_to_delivery <= 3,
+            days_to_delivery <= 7,
+            days_to_delivery <= 30,
+        ],
+        ["overdue", "emergency", "urgent", "standard", "planned"],
+        default="long_lead",
+    )
+
+
+def _clean_currency(amount: pd.Series) -> pd.Series:
+    """Strip currency symbols and convert to float, converting euro amounts to USD."""
+    if pd.api.types.is_numeric_dtype(amount):
+        return amount.astype(float)
+
+    text = amount.astype(str)
+    is_euro = text.str.startswith("€")
+    values = pd.to_numeric(text.str.replace(r"[$€,]", "", regex=True), errors="coerce")
+    return values.where(~is_euro, values * EUR_TO_USD)
 
 
 def normalize_procurement_records(df: pd.DataFrame) -> pd.DataFrame:
@@ -67,13 +67,13 @@ def normalize_procurement_records(df: pd.DataFrame) -> pd.DataFrame:
     console.print("  Normalizing procurement records...")
 
     if "category" in df.columns:
-        df["category_normalized"] = df["category"].apply(_normalize_category)
+        df["category_normalized"] = _normalize_category(df["category"])
 
     if "amount" in df.columns:
-        df["amount_clean"] = df["amount"].apply(_clean_currency)
+        df["amount_clean"] = _clean_currency(df["amount"])
 
     if {"po_date", "delivery_date"}.issubset(df.columns):
-        df["urgency"] = df.apply(_classify_urgency, axis=1)
+        df["urgency"] = _classify_urgency(df)
 
     # Drop rows where the PO number is missing entirely
     if "po_number" in df.columns:
@@ -83,5 +83,9 @@ def normalize_procurement_records(df: pd.DataFrame) -> pd.DataFrame:
         if dropped:
             console.print(f"  [yellow]Dropped {dropped} rows with null PO numbers[/yellow]")
 
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
     console.print(f"  Normalized {len(df):,} records")
     return df
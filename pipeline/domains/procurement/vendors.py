@@ -1,6 +1,7 @@
 """Vendor performance scoring and tiering for procurement analytics."""
 
 import pandas as pd
+import numpy as np
 from rich.console import Console
 
 console = Console()
@@ -14,46 +15,31 @@ SCORE_WEIGHTS = {
     "compliance": 0.10,
 }
 
+VENDOR_TIERS = ["preferred", "approved", "conditional", "probation", "blocked"]
 
-def _compute_delivery_score(vendor_df: pd.DataFrame) -> float:
-    """Calculate on-time delivery percentage for a single vendor."""
-    if "delivery_date" not in vendor_df.columns or "expected_date" not in vendor_df.columns:
-        return 0.5
-    on_time = (vendor_df["delivery_date"] <= vendor_df["expected_date"]).sum()
-    return on_time / len(vendor_df) if len(vendor_df) > 0 else 0.0
 
+def _assign_tier(score: pd.Series) -> pd.Categorical:
+    """Map composite scores to vendor tiers."""
+    tier = np.select(
+        [score >= 0.90, score >= 0.75, score >= 0.60, score >= 0.40],
+        ["preferred", "approved", "conditional", "probation"],
+        default="blocked",
+    )
+    return pd.Categorical(tier, categories=VENDOR_TIERS)
 
-def _assign_tier(score: float) -> str:
-    """Map a composite score to a vendor tier."""
-    match score:
-        case s if s >= 0.90:
-            return "preferred"
-        case s if s >= 0.75:
-            return "approved"
-        case s if s >= 0.60:
-            return "conditional"
-        case s if s >= 0.40:
-            return "probation"
-        case _:
-            return "blocked"
 
-
-def _evaluate_risk(vendor_row: dict) -> str:
-    """Classify vendor risk level based on multiple signals."""
-    order_count = vendor_row.get("order_count", 0)
-    avg_amount = vendor_row.get("avg_amount", 0)
-
-    match (order_count, avg_amount):
-        case (n, _) if n < 3:
-            return "insufficient_data"
-        case (_, amt) if amt > 100_000:
-            return "high_value"
-        case (n, amt) if n > 50 and amt < 1_000:
-            return "low_risk"
-        case (n, _) if n > 20:
-            return "medium_risk"
-        case _:
-            return "standard"
+def _evaluate_risk(order_count: pd.Series, avg_amount: pd.Series) -> np.ndarray:
+    """Classify vendor risk level based on order volume and average value."""
+    return np.select(
+        [
+            order_count < 3,
+            avg_amount > 100_000,
+            (order_count > 50) & (avg_amount < 1_000),
+            order_count > 20,
+        ],
+        ["insufficient_data", "high_value", "low_risk", "medium_risk"],
+        default="standard",
+    )
 
 
 def score_vendors(df: pd.DataFrame) -> pd.DataFrame:
@@ -63,32 +49,43 @@ def score_vendors(df: pd.DataFrame) -> pd.DataFrame:
     if "vendor_id" not in df.columns:
         return pd.DataFrame()
 
-    results = pd.DataFrame()
-    vendor_groups = df.groupby("vendor_id")
-
-    for vendor_id, group in vendor_groups:
-        delivery_score = _compute_delivery_score(group)
-        quality = group["quality_rating"].mean() if "quality_rating" in group.columns else 0.5
-        composite = (
-            delivery_score * SCORE_WEIGHTS["on_time_delivery"]
-            + quality * SCORE_WEIGHTS["quality_rating"]
-            + 0.5 * SCORE_WEIGHTS["price_competitiveness"]
-            + 0.5 * SCORE_WEIGHTS["responsiveness"]
-            + 0.5 * SCORE_WEIGHTS["compliance"]
-        )
-
-        vendor_row = {
-            "vendor_id": vendor_id,
-            "order_count": len(group),
-            "avg_amount": group["amount_clean"].mean() if "amount_clean" in group.columns else 0,
-            "delivery_score": round(delivery_score, 3),
-            "quality_score": round(quality, 3),
-            "composite_score": round(composite, 3),
-            "tier": _assign_tier(composite),
+    # per-row signals; missing inputs fall back to a neutral 0.5 score
+    if {"delivery_date", "expected_date"}.issubset(df.columns):
+        on_time = (df["delivery_date"] <= df["expected_date"]).astype(float)
+    else:
+        on_time = 0.5
+    signals = pd.DataFrame(
+        {
+            "vendor_id": df["vendor_id"],
+            "on_time": on_time,
+            "quality": df["quality_rating"] if "quality_rating" in df.columns else 0.5,
+            "amount": df["amount_clean"] if "amount_clean" in df.columns else 0,
         }
-        vendor_row["risk_level"] = _evaluate_risk(vendor_row)
-        entry = pd.DataFrame([vendor_row])
-        results = results.append(entry, ignore_index=True)
+    )
+
+    results = (
+        signals.groupby("vendor_id", observed=True)
+        .agg(
+            order_count=("on_time", "size"),
+            avg_amount=("amount", "mean"),
+            delivery_score=("on_time", "mean"),
+            quality_score=("quality", "mean"),
+        )
+        .reset_index()
+    )
+
+    composite = (
+        results["delivery_score"] * SCORE_WEIGHTS["on_time_delivery"]
+        + results["quality_score"] * SCORE_WEIGHTS["quality_rating"]
+        + 0.5 * SCORE_WEIGHTS["price_competitiveness"]
+        + 0.5 * SCORE_WEIGHTS["responsiveness"]
+        + 0.5 * SCORE_WEIGHTS["compliance"]
+    )
+    results["delivery_score"] = results["delivery_score"].round(3)
+    results["quality_score"] = results["quality_score"].round(3)
+    results["composite_score"] = composite.round(3)
+    results["tier"] = _assign_tier(composite)
+    results["risk_level"] = _evaluate_risk(results["order_count"], results["avg_amount"])
 
     console.print(f"  Scored {len(results)} vendors")
     return results.sort_values("composite_score", ascending=False)
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 type AuditType = str       # "internal" | "external" | "supplier" | "regulatory"
 type FindingSeverity = str  # "critical" | "major" | "minor" | "observation"
-type ComplianceGap = dict[str, str | float]
+type ComplianceGaps = pd.DataFrame
 
 AUDIT_FEED_PATH = "s3://prod-data-pipeline/quality/audits/"
 
@@ -21,21 +21,23 @@ STANDARD_CLAUSES = {
     "AS9100": ["4.4", "7.1", "8.1", "8.4", "8.5", "9.1", "10.2"],
 }
 
+AUDIT_PREFIX_MAP: dict[str, AuditType] = {
+    "INT": "internal", "IA": "internal",
+    "EXT": "external", "EA": "external", "CB": "external",
+    "SUP": "supplier", "SA": "supplier",
+    "REG": "regulatory", "GOV": "regulatory", "FDA": "regulatory",
+}
+
 
-def _classify_audit(audit_code: str) -> AuditType:
+def _classify_audit(audit_code: pd.Series) -> pd.Series:
     """Determine audit type from the audit code prefix."""
-    match audit_code.split("-")[0].upper():
-        case "INT" | "IA":
-            return "internal"
-        case "EXT" | "EA" | "CB":
-            return "external"
-        case "SUP" | "SA":
-            return "supplier"
-        case "REG" | "GOV" | "FDA":
-            return "regulatory"
-        case prefix:
-            logger.warning(f"Unknown audit prefix: {prefix}")
-            return "internal"
+    prefix = audit_code.str.split("-", n=1).str[0].str.upper()
+    audit_type = prefix.map(AUDIT_PREFIX_MAP)
+
+    unknown = audit_type.isna()
+    if unknown.any():
+        logger.warning(f"Unknown audit prefixes: {sorted(prefix[unknown].dropna().unique())}")
+    return audit_type.fillna("internal")
 
 
 def _rate_finding(finding_type: str, repeat: bool) -> FindingSeverity:
@@ -55,17 +57,39 @@ def _rate_finding(finding_type: str, repeat: bool) -> FindingSeverity:
             return "minor"
 
 
+FINDING_TYPES = ("nonconformity", "observation", "opportunity")
+
+SEVERITY_LOOKUP = pd.DataFrame(
+    [
+        (finding_type, repeat, _rate_finding(finding_type, repeat))
+        for finding_type in FINDING_TYPES
+        for repeat in (True, False)
+    ],
+    columns=["finding_type", "is_repeat", "severity"],
+)
+
+
+def _rate_findings(raw: pd.DataFrame) -> pd.Series:
+    """Join each finding's (finding_type, is_repeat) pair onto the severity lookup."""
+    finding_type = (
+        raw["finding_type"].fillna("observation").str.lower()
+        if "finding_type" in raw.columns else "observation"
+    )
+    keys = pd.DataFrame(
+        {"finding_type": finding_type, "is_repeat": raw["is_repeat"]}, index=raw.index
+    )
+    merged = keys.merge(SEVERITY_LOOKUP, on=["finding_type", "is_repeat"], how="left")
+    return pd.Series(merged["severity"].fillna("minor").to_numpy(), index=raw.index)
+
+
 def _identify_compliance_gaps(
     findings_df: pd.DataFrame, standard: str
-) -> list[ComplianceGap]:
+) -> ComplianceGaps:
     """Cross-reference findings against standard clauses to find coverage gaps."""
     clauses = STANDARD_CLAUSES.get(standard, [])
     covered = set(findings_df["clause_ref"].dropna().unique()) if "clause_ref" in findings_df.columns else set()
-    gaps = []
-    for clause in clauses:
-        if clause not in covered:
-            gaps.append({"standard": standard, "clause": clause, "status": "not_audited"})
-    return gaps
+    missing = [clause for clause in clauses if clause not in covered]
+    return pd.DataFrame({"standard": standard, "clause": missing, "status": "not_audited"})
 
 
 def compile_audit_findings(
@@ -77,27 +101,28 @@ def compile_audit_findings(
     Returns a DataFrame of findings enriched with severity ratings and
     a flag for any compliance gaps found against the target standard.
     """
+    # push the plant restriction down to the parquet scan so other plants'
+    # row groups are never read
+    plant_filter = [("plant_id", "in", plants)] if plants else None
     try:
-        raw = pd.read_parquet(AUDIT_FEED_PATH)
+        raw = pd.read_parquet(AUDIT_FEED_PATH, filters=plant_filter)
     except Exception as exc:
         logger.error(f"Could not load audit data: {exc}")
         return pd.DataFrame()
 
-    if plants:
-        raw = raw[raw["plant_id"].isin(plants)]
-
-    raw["audit_type"] = raw["audit_code"].apply(_classify_audit)
+    raw["audit_type"] = _classify_audit(raw["audit_code"])
 
     if "is_repeat" not in raw.columns:
         raw["is_repeat"] = False
 
-    raw["severity"] = raw.apply(
-        lambda r: _rate_finding(r.get("finding_type", "observation"), r["is_repeat"]),
-        axis=1,
-    )
+    raw["severity"] = _rate_findings(raw)
+
+    for col in ("plant_id", "audit_type", "severity"):
+        if col in raw.columns:
+            raw[col] = raw[col].astype("category")
 
     gaps = _identify_compliance_gaps(raw, standard)
-    if gaps:
+    if not gaps.empty:
         logger.warning(f"Found {len(gaps)} unaudited clauses for {standard}")
 
     raw["computed_at"] = datetime.now()
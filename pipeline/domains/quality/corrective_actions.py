@@ -37,20 +37,67 @@ def _classify_capa_type(source_type: str, severity: str) -> str:
             return "corrective_standard"
 
 
-def _evaluate_effectiveness(pre_rate: float, post_rate: float) -> str:
+CAPA_SOURCE_TYPES = (
+    "ncr", "customer_complaint", "audit", "regulatory", "trend", "risk_assessment",
+)
+CAPA_SEVERITIES = ("critical", "major", "minor", "observation")
+
+CAPA_TYPE_LOOKUP = pd.DataFrame(
+    [
+        (source_type, severity, _classify_capa_type(source_type, severity))
+        for source_type in CAPA_SOURCE_TYPES
+        for severity in CAPA_SEVERITIES
+    ],
+    columns=["source_type", "severity", "capa_type"],
+)
+
+
+def _capa_key(raw: pd.DataFrame, column: str, default: str):
+    """Normalized join key for the CAPA type lookup, defaulting when absent."""
+    if column not in raw.columns:
+        return default
+    return raw[column].fillna(default).str.lower()
+
+
+def _assign_capa_types(raw: pd.DataFrame) -> pd.Series:
+    """Join each CAPA's (source_type, severity) pair onto the CAPA type lookup."""
+    keys = pd.DataFrame(
+        {
+            "source_type": _capa_key(raw, "source_type", "ncr"),
+            "severity": _capa_key(raw, "severity", "minor"),
+        },
+        index=raw.index,
+    )
+    merged = keys.merge(CAPA_TYPE_LOOKUP, on=["source_type", "severity"], how="left")
+    capa_type = pd.Series(merged["capa_type"].to_numpy(), index=raw.index)
+
+    # pairs outside the enumerated vocabulary still follow the wildcard rules
+    unmatched = capa_type.isna()
+    if unmatched.any():
+        extra = keys[unmatched].drop_duplicates()
+        extra["capa_type"] = [_classify_capa_type(s, v) for s, v in extra.itertuples(index=False)]
+        fallback = keys[unmatched].merge(extra, on=["source_type", "severity"], how="left")
+        capa_type[unmatched] = fallback["capa_type"].to_numpy()
+
+    return capa_type
+
+
+def _evaluate_effectiveness(capa_df: pd.DataFrame) -> np.ndarray:
     """Assess CAPA effectiveness by comparing pre/post defect rates."""
-    if pre_rate == 0:
-        return "not_applicable"
-    reduction = (pre_rate - post_rate) / pre_rate
-    match reduction:
-        case r if r >= EFFECTIVENESS_THRESHOLDS["highly_effective"]:
-            return "highly_effective"
-        case r if r >= EFFECTIVENESS_THRESHOLDS["effective"]:
-            return "effective"
-        case r if r >= EFFECTIVENESS_THRESHOLDS["partially_effective"]:
-            return "partially_effective"
-        case _:
-            return "ineffective"
+    pre_rate = capa_df["pre_defect_rate"]
+    post_rate = capa_df.get("post_defect_rate", pre_rate)
+    reduction = (pre_rate - post_rate) / pre_rate.where(pre_rate != 0)
+
+    return np.select(
+        [
+            pre_rate == 0,
+            reduction >= EFFECTIVENESS_THRESHOLDS["highly_effective"],
+            reduction >= EFFECTIVENESS_THRESHOLDS["effective"],
+            reduction >= EFFECTIVENESS_THRESHOLDS["partially_effective"],
+        ],
+        ["not_applicable", "highly_effective", "effective", "partially_effective"],
+        default="ineffective",
+    )
 
 
 def _compute_overdue_flags(capa_df: pd.DataFrame) -> pd.DataFrame:
@@ -58,15 +105,11 @@ def _compute_overdue_flags(capa_df: pd.DataFrame) -> pd.DataFrame:
     df = capa_df.copy()
     now = pd.Timestamp.now()
     if "target_close_date" in df.columns:
-        df["target_close_date"] = pd.to_datetime(df["target_close_date"])
-        df["is_overdue"] = (
-            (df["status"] != "closed") & (df["target_close_date"] < now)
-        )
-        df["days_overdue"] = np.where(
-            df["is_overdue"],
-            (now - df["target_close_date"]).dt.days,
-            0,
-        )
+        target = pd.to_datetime(df["target_close_date"])
+        past_target = now - target
+        df["target_close_date"] = target
+        df["is_overdue"] = (df["status"] != "closed") & (past_target > pd.Timedelta(0))
+        df["days_overdue"] = past_target.dt.days.where(df["is_overdue"], 0)
     return df
 
 
@@ -82,26 +125,18 @@ def track_capa_status(defects_df: pd.DataFrame) -> pd.DataFrame:
         logger.error(f"Failed to read CAPA data: {exc}")
         return pd.DataFrame()
 
-    raw["capa_type"] = raw.apply(
-        lambda r: _classify_capa_type(
-            r.get("source_type", "ncr"), r.get("severity", "minor")
-        ),
-        axis=1,
-    )
+    raw["capa_type"] = _assign_capa_types(raw)
 
     enriched = _compute_overdue_flags(raw)
 
     # evaluate effectiveness for closed CAPAs with before/after metrics
-    results = pd.DataFrame()
-    for _, capa in enriched.iterrows():
-        row = capa.to_dict()
-        if capa.get("status") == "closed" and "pre_defect_rate" in capa.index:
-            row["effectiveness"] = _evaluate_effectiveness(
-                capa["pre_defect_rate"], capa.get("post_defect_rate", capa["pre_defect_rate"])
-            )
-        else:
-            row["effectiveness"] = "pending"
-        results = results.append(pd.DataFrame([row]), ignore_index=True)
+    results = enriched
+    if "pre_defect_rate" in results.columns and "status" in results.columns:
+        results["effectiveness"] = np.where(
+            results["status"] == "closed", _evaluate_effectiveness(results), "pending"
+        )
+    else:
+        results["effectiveness"] = "pending"
 
     overdue_count = results["is_overdue"].sum() if "is_overdue" in results.columns else 0
     logger.info(f"Tracked {len(results)} CAPAs, {overdue_count} overdue")
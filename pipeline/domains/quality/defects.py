@@ -17,6 +17,10 @@ DEFECT_CATEGORIES = {
     "cosmetic": ["label_misaligned", "print_defect", "packaging_damage"],
 }
 
+REVERSE_DEFECT_MAP = {
+    code: category for category, codes in DEFECT_CATEGORIES.items() for code in codes
+}
+
 
 def _classify_defect(defect_code: str) -> str:
     """Map a defect code to its parent category using match/case."""
@@ -33,19 +37,34 @@ def _classify_defect(defect_code: str) -> str:
             return "uncategorized"
 
 
-def _compute_pareto(defect_counts: pd.Series) -> pd.DataFrame:
-    """Build a Pareto analysis table from defect frequency counts."""
-    sorted_counts = defect_counts.sort_values(ascending=False)
-    cumulative = sorted_counts.cumsum() / sorted_counts.sum()
-    pareto = pd.DataFrame({
-        "defect_code": sorted_counts.index,
-        "count": sorted_counts.values,
-        "cumulative_pct": cumulative.values,
-    })
+def _compute_pareto(results_df: pd.DataFrame) -> pd.DataFrame:
+    """Build a per-plant Pareto analysis table from defect records."""
+    pareto = (
+        results_df.groupby(["plant_id", "defect_code"], observed=True)
+        .size()
+        .rename("count")
+        .reset_index()
+        .sort_values(["plant_id", "count"], ascending=[True, False], ignore_index=True)
+    )
+    plant_counts = pareto.groupby("plant_id", observed=True)["count"]
+    pareto["cumulative_pct"] = plant_counts.cumsum() / plant_counts.transform("sum")
     pareto["vital_few"] = pareto["cumulative_pct"] <= PARETO_THRESHOLD
     return pareto
 
 
+def _top_categories(results_df: pd.DataFrame) -> pd.Series:
+    """Most frequent defect category per (plant, week); ties go to the alphabetically first."""
+    keys = ["plant_id", "week"]
+    counts = (
+        results_df.groupby([*keys, "defect_category"], observed=True)
+        .size()
+        .rename("occurrences")
+        .reset_index()
+        .sort_values(["occurrences", "defect_category"], ascending=[False, True])
+    )
+    return counts.drop_duplicates(keys).set_index(keys)["defect_category"]
+
+
 def analyze_defect_trends(results_df: pd.DataFrame) -> pd.DataFrame:
     """Produce defect trending and Pareto analysis across plants.
 
@@ -56,28 +75,24 @@ def analyze_defect_trends(results_df: pd.DataFrame) -> pd.DataFrame:
         logger.warning("No defect_code column present; skipping defect analysis")
         return pd.DataFrame()
 
-    results_df["defect_category"] = results_df["defect_code"].apply(_classify_defect)
-
-    trending = pd.DataFrame()
+    results_df["defect_category"] = (
+        results_df["defect_code"].str.lower().str.strip()
+        .map(REVERSE_DEFECT_MAP)
+        .fillna("uncategorized")
+    )
 
-    for plant_id, plant_group in results_df.groupby("plant_id"):
-        pareto = _compute_pareto(plant_group["defect_code"].value_counts())
-        pareto["plant_id"] = plant_id
-        trending = trending.append(pareto, ignore_index=True)
+    trending = _compute_pareto(results_df)
 
     # weekly trend aggregation
     weekly = pd.DataFrame()
     if "inspection_date" in results_df.columns:
         results_df["week"] = results_df["inspection_date"].dt.isocalendar().week
-        for (plant, week), grp in results_df.groupby(["plant_id", "week"]):
-            row = pd.DataFrame([{
-                "plant_id": plant,
-                "week": week,
-                "defect_count": grp["defect_count"].sum(),
-                "sample_size": grp["sample_size"].sum(),
-                "top_category": grp["defect_category"].mode().iloc[0] if len(grp) > 0 else None,
-            }])
-            weekly = weekly.append(row, ignore_index=True)
+        weekly = results_df.groupby(["plant_id", "week"], observed=True).agg(
+            defect_count=("defect_count", "sum"),
+            sample_size=("sample_size", "sum"),
+        )
+        weekly["top_category"] = _top_categories(results_df)
+        weekly = weekly.reset_index()
 
     logger.info(f"Analyzed defects for {results_df['plant_id'].nunique()} plants")
     return trending
@@ -1,7 +1,9 @@
 """Ingest QC inspection data from plant MES systems and manual entry portals."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 
 import pandas as pd
 
@@ -17,6 +19,8 @@ PLANT_FEEDS = {
     "plant-04": "s3://prod-data-pipeline/quality/plant_04/inspections/",
 }
 
+MAX_READ_WORKERS = 8
+
 
 def _read_mes_feed(plant_id: str, path: str, cutoff: datetime) -> pd.DataFrame:
     """Pull inspection records from the MES export for a plant."""
@@ -43,6 +47,15 @@ def _read_manual_entries(plant_id: str) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def _read_plant_inspections(plant_id: str, cutoff: datetime) -> list[pd.DataFrame]:
+    """Read a plant's MES feed followed by any manual entries."""
+    frames = [_read_mes_feed(plant_id, PLANT_FEEDS[plant_id], cutoff)]
+    manual = _read_manual_entries(plant_id)
+    if not manual.empty:
+        frames.append(manual)
+    return frames
+
+
 def ingest_inspection_data(
     plants: list[str] | None = None,
     lookback_days: int = 90,
@@ -50,24 +63,27 @@ def ingest_inspection_data(
     """Combine inspection records across plants for the lookback window.
 
     Merges MES-generated inspection records with manually digitized paper
-    forms from the quality lab.
+    forms from the quality lab.  Plants are read concurrently and combined
+    with a single concat.
     """
     targets = plants or list(PLANT_FEEDS.keys())
     cutoff = datetime.now() - timedelta(days=lookback_days)
-    combined = pd.DataFrame()
 
+    known_plants = []
     for plant_id in targets:
         if plant_id not in PLANT_FEEDS:
             logger.error(f"Unknown plant identifier: {plant_id}")
             continue
+        known_plants.append(plant_id)
 
-        feed = _read_mes_feed(plant_id, PLANT_FEEDS[plant_id], cutoff)
-
-        manual = _read_manual_entries(plant_id)
-        if not manual.empty:
-            feed = feed.append(manual, ignore_index=True)
+    # plant reads are S3-bound, so overlap them; results come back in plant order
+    frames: list[pd.DataFrame] = []
+    if known_plants:
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(known_plants))) as pool:
+            for plant_frames in pool.map(partial(_read_plant_inspections, cutoff=cutoff), known_plants):
+                frames.extend(plant_frames)
 
-        combined = combined.append(feed, ignore_index=True)
+    combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
     if combined.empty:
         raise RuntimeError("No inspection data ingested — verify MES connectivity")
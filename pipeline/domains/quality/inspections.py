@@ -6,7 +6,6 @@ from datetime import datetime
 import pandas as pd
 import numpy as np
 
-type LotResult = dict[str, str | float | int]
 type InspectionSummary = pd.DataFrame
 
 logger = logging.getLogger(__name__)
@@ -19,25 +18,35 @@ RESULT_WEIGHTS: dict[str, float] = {
 }
 
 
-def _build_lot_summary(lot_df: pd.DataFrame) -> LotResult:
-    """Compute aggregate pass/fail metrics for a single production lot."""
-    total_inspected = lot_df["sample_size"].sum()
-    total_defects = lot_df["defect_count"].sum()
-    rate = total_defects / total_inspected if total_inspected > 0 else 0.0
-    return {
-        "lot_id": lot_df["lot_id"].iloc[0],
-        "total_inspected": int(total_inspected),
-        "total_defects": int(total_defects),
-        "defect_rate": round(rate, 6),
-        "inspections": len(lot_df),
-    }
+def _disposition_weights(df: pd.DataFrame) -> pd.Series:
+    """Per-inspection disposition weight; unknown dispositions score zero."""
+    disposition = df["disposition"]
+    return disposition.map(RESULT_WEIGHTS).astype("float64").fillna(0.0).where(disposition.notna())
 
 
-def _score_disposition_mix(df: pd.DataFrame) -> float:
-    """Weighted score for the disposition distribution of a group."""
-    counts = df["disposition"].value_counts(normalize=True)
-    score = sum(RESULT_WEIGHTS.get(d, 0.0) * pct for d, pct in counts.items())
-    return round(score, 4)
+def _build_lot_summary(inspections_df: pd.DataFrame, weights: pd.Series) -> InspectionSummary:
+    """Compute aggregate pass/fail metrics and disposition score per production lot."""
+    lots = inspections_df.groupby("lot_id").agg(
+        total_inspected=("sample_size", "sum"),
+        total_defects=("defect_count", "sum"),
+        inspections=("lot_id", "size"),
+        plant_id=("plant_id", "first"),
+    )
+    rate = lots["total_defects"] / lots["total_inspected"].where(lots["total_inspected"] > 0)
+    lots["defect_rate"] = rate.fillna(0.0).round(6)
+    lots["total_inspected"] = lots["total_inspected"].astype("int64")
+    lots["total_defects"] = lots["total_defects"].astype("int64")
+    lots["disposition_score"] = _score_disposition_mix(weights, inspections_df["lot_id"])
+
+    return lots.reset_index()[[
+        "lot_id", "total_inspected", "total_defects", "defect_rate",
+        "inspections", "disposition_score", "plant_id",
+    ]]
+
+
+def _score_disposition_mix(weights: pd.Series, keys: pd.Series) -> pd.Series:
+    """Weighted score for the disposition distribution of each group."""
+    return weights.groupby(keys).mean().fillna(0.0).round(4)
 
 
 def track_inspection_results(inspections_df: pd.DataFrame) -> InspectionSummary:
@@ -51,26 +60,20 @@ def track_inspection_results(inspections_df: pd.DataFrame) -> InspectionSummary:
             inspections_df["inspection_date"].dt.strftime("%Y%m%d")
         )
 
-    results = pd.DataFrame()
-
-    for lot_id, lot_group in inspections_df.groupby("lot_id"):
-        summary = _build_lot_summary(lot_group)
-        summary["disposition_score"] = _score_disposition_mix(lot_group)
-        summary["plant_id"] = lot_group["plant_id"].iloc[0]
-        row = pd.DataFrame([summary])
-        results = results.append(row, ignore_index=True)
+    weights = _disposition_weights(inspections_df)
+    results = _build_lot_summary(inspections_df, weights)
 
     # add line-level rollup for trending
     line_results = pd.DataFrame()
     if "line_id" in inspections_df.columns:
-        for line_id, line_group in inspections_df.groupby("line_id"):
-            line_row = pd.DataFrame([{
-                "line_id": line_id,
-                "total_lots": line_group["lot_id"].nunique(),
-                "avg_defect_rate": line_group["defect_rate"].mean(),
-                "disposition_score": _score_disposition_mix(line_group),
-            }])
-            line_results = line_results.append(line_row, ignore_index=True)
+        line_results = inspections_df.groupby("line_id").agg(
+            total_lots=("lot_id", "nunique"),
+            avg_defect_rate=("defect_rate", "mean"),
+        )
+        line_results["disposition_score"] = _score_disposition_mix(
+            weights, inspections_df["line_id"]
+        )
+        line_results = line_results.reset_index()
 
     results["computed_at"] = datetime.now()
     logger.info(f"Tracked results for {len(results)} lots across {len(line_results)} lines")
@@ -10,6 +10,11 @@ logger = logging.getLogger(__name__)
 
 SIGMA_TABLE = {1: 691_462, 2: 308_538, 3: 66_807, 4: 6_210, 5: 233, 6: 3.4}
 
+# SIGMA_TABLE as parallel arrays ordered by ascending DPMO threshold
+_SIGMA_BY_THRESHOLD = sorted(SIGMA_TABLE.items(), key=lambda item: item[1])
+SIGMA_LEVELS = np.array([sigma for sigma, _ in _SIGMA_BY_THRESHOLD], dtype="float64")
+SIGMA_THRESHOLDS = np.array([threshold for _, threshold in _SIGMA_BY_THRESHOLD], dtype="float64")
+
 KPI_TARGETS = {
     "ppm": 500,
     "dpmo": 3_400,
@@ -17,33 +22,42 @@ KPI_TARGETS = {
     "cop_index": 1.33,
 }
 
+KPI_PRECISION = {"ppm": 2, "dpmo": 2, "first_pass_yield": 4}
+
+
+def _rate(numerator: pd.Series, denominator: pd.Series) -> np.ndarray:
+    """Element-wise numerator / denominator, 0.0 where the denominator is not positive."""
+    denominator = denominator.to_numpy(dtype="float64")
+    return np.divide(
+        numerator.to_numpy(dtype="float64"),
+        denominator,
+        out=np.zeros(len(denominator)),
+        where=denominator > 0,
+    )
+
 
-def _compute_ppm(defects: int, units_inspected: int) -> float:
+def _compute_ppm(defects: pd.Series, units_inspected: pd.Series) -> np.ndarray:
     """Parts per million defective."""
-    if units_inspected == 0:
-        return 0.0
-    return (defects / units_inspected) * 1_000_000
+    return _rate(defects, units_inspected) * 1_000_000
 
 
-def _compute_dpmo(defects: int, units: int, opportunities_per_unit: int = 5) -> float:
+def _compute_dpmo(defects: pd.Series, units: pd.Series, opportunities_per_unit: int = 5) -> np.ndarray:
     """Defects per million opportunities."""
-    total_opportunities = units * opportunities_per_unit
-    if total_opportunities == 0:
-        return 0.0
-    return (defects / total_opportunities) * 1_000_000
+    return _rate(defects, units * opportunities_per_unit) * 1_000_000
 
 
-def _estimate_sigma(dpmo: float) -> float:
+def _estimate_sigma(dpmo: pd.Series) -> np.ndarray:
     """Approximate sigma level from DPMO using the lookup table."""
-    for sigma, threshold in sorted(SIGMA_TABLE.items()):
-        if dpmo >= threshold:
-            return float(sigma)
-    return 6.0
+    dpmo = dpmo.to_numpy(dtype="float64")
+    # number of thresholds at or below each DPMO; the highest one reached sets the level
+    reached = np.searchsorted(SIGMA_THRESHOLDS, dpmo, side="right")
+    level = SIGMA_LEVELS[np.maximum(reached - 1, 0)]
+    return np.where((reached == 0) | np.isnan(dpmo), 6.0, level)
 
 
-def _first_pass_yield(passed: int, total: int) -> float:
+def _first_pass_yield(passed: pd.Series, total: pd.Series) -> np.ndarray:
     """Fraction of units passing inspection on the first attempt."""
-    return passed / total if total > 0 else 0.0
+    return _rate(passed, total)
 
 
 def compute_quality_kpis(
@@ -59,55 +73,27 @@ def compute_quality_kpis(
       - First-pass yield
       - Target compliance flag
     """
-    kpi_rows = pd.DataFrame()
-
-    for plant_id, plant_data in results_df.groupby("plant_id"):
-        total_inspected = plant_data["total_inspected"].sum()
-        total_defects = plant_data["total_defects"].sum()
-        passed = total_inspected - total_defects
-
-        ppm = _compute_ppm(total_defects, total_inspected)
-        dpmo = _compute_dpmo(total_defects, total_inspected)
-        sigma = _estimate_sigma(dpmo)
-        fpy = _first_pass_yield(passed, total_inspected)
-
-        row = pd.DataFrame([{
-            "plant_id": plant_id,
-            "total_inspected": int(total_inspected),
-            "total_defects": int(total_defects),
-            "ppm": round(ppm, 2),
-            "dpmo": round(dpmo, 2),
-            "sigma_level": sigma,
-            "first_pass_yield": round(fpy, 4),
-            "ppm_on_target": ppm <= KPI_TARGETS["ppm"],
-            "dpmo_on_target": dpmo <= KPI_TARGETS["dpmo"],
-            "fpy_on_target": fpy >= KPI_TARGETS["first_pass_yield"],
-        }])
-        kpi_rows = kpi_rows.append(row, ignore_index=True)
+    plants = results_df.groupby("plant_id", observed=True)[["total_inspected", "total_defects"]].sum()
+    if plants.empty:
+        return pd.DataFrame()
 
     # add a company-wide rollup row
-    if not kpi_rows.empty:
-        totals = kpi_rows[["total_inspected", "total_defects"]].sum()
-        overall_ppm = _compute_ppm(int(totals["total_defects"]), int(totals["total_inspected"]))
-        overall_dpmo = _compute_dpmo(int(totals["total_defects"]), int(totals["total_inspected"]))
-        rollup = pd.DataFrame([{
-            "plant_id": "__ALL__",
-            "total_inspected": int(totals["total_inspected"]),
-            "total_defects": int(totals["total_defects"]),
-            "ppm": round(overall_ppm, 2),
-            "dpmo": round(overall_dpmo, 2),
-            "sigma_level": _estimate_sigma(overall_dpmo),
-            "first_pass_yield": round(
-                _first_pass_yield(
-                    int(totals["total_inspected"] - totals["total_defects"]),
-                    int(totals["total_inspected"]),
-                ), 4
-            ),
-            "ppm_on_target": overall_ppm <= KPI_TARGETS["ppm"],
-            "dpmo_on_target": overall_dpmo <= KPI_TARGETS["dpmo"],
-            "fpy_on_target": True,
-        }])
-        kpi_rows = kpi_rows.append(rollup, ignore_index=True)
+    rollup = pd.DataFrame([plants.sum()], index=pd.Index(["__ALL__"], name="plant_id"))
+    kpis = pd.concat([plants, rollup]).astype("int64")
+
+    total_inspected = kpis["total_inspected"]
+    total_defects = kpis["total_defects"]
+    kpis["ppm"] = _compute_ppm(total_defects, total_inspected)
+    kpis["dpmo"] = _compute_dpmo(total_defects, total_inspected)
+    kpis["sigma_level"] = _estimate_sigma(kpis["dpmo"])
+    kpis["first_pass_yield"] = _first_pass_yield(total_inspected - total_defects, total_inspected)
+    kpis["ppm_on_target"] = kpis["ppm"] <= KPI_TARGETS["ppm"]
+    kpis["dpmo_on_target"] = kpis["dpmo"] <= KPI_TARGETS["dpmo"]
+    kpis["fpy_on_target"] = kpis["first_pass_yield"] >= KPI_TARGETS["first_pass_yield"]
+    kpis.loc["__ALL__", "fpy_on_target"] = True
+
+    # round once on the finished table; target flags use the unrounded values
+    kpi_rows = kpis.reset_index().round(KPI_PRECISION)
 
     logger.info(f"Computed KPIs for {len(kpi_rows) - 1} plants plus company rollup")
     return kpi_rows
@@ -1,6 +1,7 @@
 """Non-Conformance Report (NCR) processing and disposition workflow."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import pandas as pd
@@ -12,6 +13,8 @@ logger = logging.getLogger(__name__)
 
 NCR_STATUS_ORDER = ["open", "investigating", "pending_review", "closed", "voided"]
 
+AGING_BUCKETS = ["0-7 days", "8-30 days", "31-90 days", "90+ days"]
+
 NCR_SOURCES = {
     "incoming": "s3://prod-data-pipeline/quality/ncr/incoming/",
     "in_process": "s3://prod-data-pipeline/quality/ncr/in_process/",
@@ -20,25 +23,30 @@ NCR_SOURCES = {
 }
 
 
+def _profile_dtype(dtype) -> str:
+    """Coarse type label for a column dtype."""
+    if dtype == "object":
+        return "string"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    return "other"
+
+
 def _enrich_ncr_metadata(ncr_df: pd.DataFrame) -> pd.DataFrame:
-    """Add computed fields to raw NCR records by iterating columns."""
-    enriched = ncr_df.copy()
-    col_types = {}
-    for col_name, col_data in enriched.iteritems():
-        if col_data.dtype == "object":
-            col_types[col_name] = "string"
-        elif pd.api.types.is_numeric_dtype(col_data):
-            col_types[col_name] = "numeric"
-        else:
-            col_types[col_name] = "other"
+    """Add computed fields to raw NCR records.
 
-    enriched["_col_profile"] = str(col_types)
+    The column type profile is table-level metadata, so it is kept once in
+    ``attrs["col_profile"]`` rather than repeated on every row.
+    """
+    enriched = ncr_df.copy()
+    enriched.attrs["col_profile"] = {
+        col_name: _profile_dtype(dtype) for col_name, dtype in enriched.dtypes.items()
+    }
 
     if "created_date" in enriched.columns and "closed_date" in enriched.columns:
-        enriched["days_open"] = (
-            pd.to_datetime(enriched["closed_date"]) -
-            pd.to_datetime(enriched["created_date"])
-        ).dt.days
+        enriched["created_date"] = pd.to_datetime(enriched["created_date"])
+        enriched["closed_date"] = pd.to_datetime(enriched["closed_date"])
+        enriched["days_open"] = (enriched["closed_date"] - enriched["created_date"]).dt.days
 
     return enriched
 
@@ -53,31 +61,27 @@ def _compute_aging_buckets(ncr_df: pd.DataFrame) -> pd.DataFrame:
     open_ncrs = open_ncrs.copy()
     open_ncrs["age_days"] = (now - pd.to_datetime(open_ncrs["created_date"])).dt.days
 
-    buckets = pd.DataFrame()
-    for _, row in open_ncrs.iterrows():
-        age = row["age_days"]
-        if age <= 7:
-            bucket = "0-7 days"
-        elif age <= 30:
-            bucket = "8-30 days"
-        elif age <= 90:
-            bucket = "31-90 days"
-        else:
-            bucket = "90+ days"
-        entry = pd.DataFrame([{**row.to_dict(), "aging_bucket": bucket}])
-        buckets = buckets.append(entry, ignore_index=True)
+    # NCRs without a usable created_date fall into the oldest bucket
+    open_ncrs["aging_bucket"] = pd.cut(
+        open_ncrs["age_days"],
+        bins=[-np.inf, 7, 30, 90, np.inf],
+        labels=AGING_BUCKETS,
+    ).fillna("90+ days")
 
-    return buckets
+    return open_ncrs.reset_index(drop=True)
 
 
 def _validate_ncr_fields(ncr_df: pd.DataFrame) -> list[str]:
-    """Check column completeness using iteritems for field-level profiling."""
-    issues = []
-    for col_name, col_values in ncr_df.iteritems():
-        null_rate = col_values.isna().mean()
-        if null_rate > 0.25:
-            issues.append(f"{col_name}: {null_rate:.1%} null")
-    return issues
+    """Flag columns whose null rate exceeds 25%."""
+    null_rates = ncr_df.isna().mean()
+    return [f"{col_name}: {rate:.1%} null" for col_name, rate in null_rates[null_rates > 0.25].items()]
+
+
+def _read_ncr_feed(source_name: str, source_path: str) -> pd.DataFrame:
+    """Read one NCR source feed and tag it with its origin."""
+    feed = pd.read_parquet(source_path)
+    feed["ncr_source"] = source_name
+    return feed
 
 
 def process_nonconformance_reports(inspections_df: pd.DataFrame) -> pd.DataFrame:
@@ -86,16 +90,20 @@ def process_nonconformance_reports(inspections_df: pd.DataFrame) -> pd.DataFrame
     Combines NCR feeds from incoming, in-process, final, and customer
     complaint sources into a unified report with aging analysis.
     """
-    combined = pd.DataFrame()
-
-    for source_name, source_path in NCR_SOURCES.items():
-        try:
-            feed = pd.read_parquet(source_path)
-            feed["ncr_source"] = source_name
-            combined = combined.append(feed, ignore_index=True)
-        except Exception as exc:
-            logger.error(f"Failed to read NCR feed {source_name}: {exc}")
-
+    # the feeds are independent S3 reads, so fetch them concurrently
+    frames: list[pd.DataFrame] = []
+    with ThreadPoolExecutor(max_workers=len(NCR_SOURCES)) as pool:
+        futures = {
+            source_name: pool.submit(_read_ncr_feed, source_name, source_path)
+            for source_name, source_path in NCR_SOURCES.items()
+        }
+        for source_name, future in futures.items():
+            try:
+                frames.append(future.result())
+            except Exception as exc:
+                logger.error(f"Failed to read NCR feed {source_name}: {exc}")
+
+    combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
     if combined.empty:
         return pd.DataFrame()
 
@@ -4,7 +4,6 @@ import pandas as pd
 import numpy as np
 
 type InspectionDisposition = str  # "accept" | "reject" | "hold" | "rework"
-type SeverityLevel = str  # "critical" | "major" | "minor" | "observation"
 
 LEGACY_FIELD_MAP: dict[str, str] = {
     "insp_id": "inspection_id",
@@ -17,33 +16,24 @@ LEGACY_FIELD_MAP: dict[str, str] = {
     "qty_defective": "defect_count",
 }
 
+DISPOSITION_MAP: dict[str, InspectionDisposition] = {
+    **dict.fromkeys(["A", "ACC", "ACCEPT", "PASS"], "accept"),
+    **dict.fromkeys(["R", "REJ", "REJECT", "FAIL"], "reject"),
+    **dict.fromkeys(["H", "HOLD", "QUARANTINE", "QH"], "hold"),
+    **dict.fromkeys(["RW", "REWORK", "REPROCESS"], "rework"),
+}
 
-def _normalize_disposition(raw: str) -> InspectionDisposition:
-    """Map various disposition codes to standard values."""
-    match raw.strip().upper():
-        case "A" | "ACC" | "ACCEPT" | "PASS":
-            return "accept"
-        case "R" | "REJ" | "REJECT" | "FAIL":
-            return "reject"
-        case "H" | "HOLD" | "QUARANTINE" | "QH":
-            return "hold"
-        case "RW" | "REWORK" | "REPROCESS":
-            return "rework"
-        case code:
-            raise ValueError(f"Unknown disposition code: {code}")
+# low-cardinality keys used for grouping and comparisons downstream
+CATEGORICAL_COLUMNS = ("plant_id", "defect_code", "disposition", "severity")
 
 
-def _classify_severity(defect_rate: float) -> SeverityLevel:
+def _classify_severity(defect_rate: pd.Series) -> np.ndarray:
     """Assign severity based on the defect rate of the inspection lot."""
-    match defect_rate:
-        case r if r >= 0.10:
-            return "critical"
-        case r if r >= 0.05:
-            return "major"
-        case r if r >= 0.01:
-            return "minor"
-        case _:
-            return "observation"
+    return np.select(
+        [defect_rate >= 0.10, defect_rate >= 0.05, defect_rate >= 0.01],
+        ["critical", "major", "minor"],
+        default="observation",
+    )
 
 
 def normalize_inspections(raw_df: pd.DataFrame) -> pd.DataFrame:
@@ -52,9 +42,8 @@ def normalize_inspections(raw_df: pd.DataFrame) -> pd.DataFrame:
     Handles legacy column remapping, disposition normalization, severity
     classification, and basic data integrity filters.
     """
-    df = raw_df.rename(
-        columns={k: v for k, v in LEGACY_FIELD_MAP.items() if k in raw_df.columns}
-    )
+    legacy_cols = raw_df.columns.intersection(LEGACY_FIELD_MAP.keys())
+    df = raw_df.rename(columns={col: LEGACY_FIELD_MAP[col] for col in legacy_cols})
 
     df["inspection_date"] = pd.to_datetime(df["inspection_date"], errors="coerce")
     df = df.dropna(subset=["inspection_id", "inspection_date"])
@@ -62,14 +51,22 @@ def normalize_inspections(raw_df: pd.DataFrame) -> pd.DataFrame:
     df["sample_size"] = pd.to_numeric(df["sample_size"], errors="coerce").fillna(0).astype(int)
     df["defect_count"] = pd.to_numeric(df["defect_count"], errors="coerce").fillna(0).astype(int)
 
-    df["disposition"] = df["disposition"].apply(_normalize_disposition)
+    codes = df["disposition"].str.strip().str.upper()
+    df["disposition"] = codes.map(DISPOSITION_MAP)
+    unknown = df["disposition"].isna()
+    if unknown.any():
+        raise ValueError(f"Unknown disposition codes: {codes[unknown].unique().tolist()}")
 
     df["defect_rate"] = np.where(
         df["sample_size"] > 0,
         df["defect_count"] / df["sample_size"],
         0.0,
     )
-    df["severity"] = df["defect_rate"].apply(_classify_severity)
+    df["severity"] = _classify_severity(df["defect_rate"])
+
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
 
     df = df.sort_values("inspection_date").reset_index(drop=True)
     return df
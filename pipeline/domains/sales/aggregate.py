@@ -15,13 +15,17 @@ def _aggregate_by_dimension(
     dimension: str,
     value_col: str = "amount",
 ) -> pd.DataFrame:
-    """Compute standard metrics for one grouping dimension."""
-    agg = df.groupby(dimension).agg(
-        total_amount=(value_col, "sum"),
-        avg_amount=(value_col, "mean"),
-        transaction_count=(value_col, "count"),
-        min_amount=(value_col, "min"),
-        max_amount=(value_col, "max"),
+    """Compute standard metrics for one grouping dimension.
+
+    Only the value column is grouped, so the wide sales frame is never
+    carried through the aggregation.
+    """
+    agg = df.groupby(dimension, observed=True)[value_col].agg(
+        total_amount="sum",
+        avg_amount="mean",
+        transaction_count="count",
+        min_amount="min",
+        max_amount="max",
     ).reset_index()
 
     agg["avg_amount"] = agg["avg_amount"].round(2)
@@ -52,30 +56,22 @@ def build_sales_summaries(df: pd.DataFrame) -> AggResult:
         results[f"by_{dim}"] = _aggregate_by_dimension(df, dim)
 
     # Time-based rollups at multiple grains
-    time_summary = pd.DataFrame()
-    for grain in TIME_GRAINS:
-        grain_df = _build_time_series(df, grain)
-        time_summary = time_summary.append(grain_df, ignore_index=True)
-    results["time_series"] = time_summary
+    grain_frames = [_build_time_series(df, grain) for grain in TIME_GRAINS]
+    grain_frames = [frame for frame in grain_frames if not frame.empty]
+    results["time_series"] = pd.concat(grain_frames, ignore_index=True) if grain_frames else pd.DataFrame()
 
     # Cross-tab: region x channel
     if {"region", "channel"}.issubset(df.columns):
-        cross = pd.DataFrame()
-        for region in df["region"].unique():
-            region_data = df[df["region"] == region]
-            channel_agg = region_data.groupby("channel")["amount"].sum().reset_index()
-            channel_agg["region"] = region
-            cross = cross.append(channel_agg, ignore_index=True)
-        results["region_channel"] = cross
+        results["region_channel"] = df.groupby(["region", "channel"])["amount"].sum().reset_index()
 
     # Top products per region
     if {"region", "product_id", "amount"}.issubset(set(df.columns)):
-        top_products = pd.DataFrame()
-        for region in df["region"].unique():
-            subset = df[df["region"] == region]
-            top = subset.groupby("product_id")["amount"].sum().nlargest(10).reset_index()
-            top["region"] = region
-            top_products = top_products.append(top, ignore_index=True)
-        results["top_products"] = top_products
+        product_totals = df.groupby(["region", "product_id"])["amount"].sum().reset_index()
+        results["top_products"] = (
+            product_totals.sort_values(["region", "amount"], ascending=[True, False])
+            .groupby("region")
+            .head(10)
+            .reset_index(drop=True)
+        )
 
     return results
@@ -19,30 +19,49 @@ class SegmentThresholds:
     churn_days: int = 365
 
 
+SEGMENT_LABELS = [
+    "vip_active",
+    "vip_churned",
+    "vip_at_risk",
+    "loyal",
+    "regular",
+    "new_or_casual",
+    "inactive",
+    "other",
+]
+
+
 def _classify_customer(
-    total_spend: float,
-    days_since_last: int,
-    order_count: int,
+    total_spend: pd.Series,
+    days_since_last: pd.Series,
+    order_count: pd.Series,
     thresholds: SegmentThresholds,
-) -> SegmentLabel:
-    """Assign a customer to a segment based on their behavior."""
-    match (total_spend, days_since_last, order_count):
-        case (spend, days, count) if spend >= thresholds.high_value_min and days <= thresholds.active_days:
-            return "vip_active"
-        case (spend, days, _) if spend >= thresholds.high_value_min and days > thresholds.churn_days:
-            return "vip_churned"
-        case (spend, days, _) if spend >= thresholds.high_value_min:
-            return "vip_at_risk"
-        case (spend, days, count) if spend >= thresholds.medium_value_min and count >= 5:
-            return "loyal"
-        case (spend, days, _) if spend >= thresholds.medium_value_min and days <= thresholds.active_days:
-            return "regular"
-        case (_, days, _) if days <= thresholds.active_days:
-            return "new_or_casual"
-        case (_, days, _) if days > thresholds.churn_days:
-            return "inactive"
-        case _:
-            return "other"
+) -> pd.Categorical:
+    """Assign each customer to a segment based on their behavior.
+
+    Conditions are evaluated in priority order; the first match wins.
+    Segments are selected as int8 codes into SEGMENT_LABELS so no
+    per-customer string array is materialized.
+    """
+    high_value = total_spend >= thresholds.high_value_min
+    medium_value = total_spend >= thresholds.medium_value_min
+    active = days_since_last <= thresholds.active_days
+    churned = days_since_last > thresholds.churn_days
+
+    codes = np.select(
+        [
+            high_value & active,
+            high_value & churned,
+            high_value,
+            medium_value & (order_count >= 5),
+            medium_value & active,
+            active,
+            churned,
+        ],
+        np.arange(len(SEGMENT_LABELS) - 1, dtype="int8"),
+        default=np.int8(len(SEGMENT_LABELS) - 1),
+    )
+    return pd.Categorical.from_codes(codes, categories=SEGMENT_LABELS)
 
 
 def segment_customers(
@@ -68,14 +87,11 @@ def segment_customers(
     cust["tenure_days"] = (cust["last_order"] - cust["first_order"]).dt.days
 
     # Classify each customer
-    cust["segment"] = cust.apply(
-        lambda row: _classify_customer(
-            row["total_spend"],
-            row["days_since_last"],
-            row["order_count"],
-            thresholds,
-        ),
-        axis=1,
+    cust["segment"] = _classify_customer(
+        cust["total_spend"],
+        cust["days_since_last"],
+        cust["order_count"],
+        thresholds,
     )
 
     return cust
@@ -83,7 +99,7 @@ def segment_customers(
 
 def get_segment_summary(customer_df: pd.DataFrame) -> pd.DataFrame:
     """Summarize segment sizes and average metrics."""
-    summary = customer_df.groupby("segment").agg(
+    summary = customer_df.groupby("segment", observed=True).agg(
         customer_count=("customer_id", "count"),
         avg_spend=("total_spend", "mean"),
         avg_orders=("order_count", "mean"),
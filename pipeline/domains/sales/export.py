@@ -1,11 +1,15 @@
 """Export sales pipeline outputs to various destinations."""
 
 import tomllib
+from collections.abc import Mapping
+from functools import cache
 from pathlib import Path
 
 import pandas as pd
 from rich.console import Console
 
+from pipeline.utils.io import freeze_config
+
 type AggResult = dict[str, pd.DataFrame]
 type SalesReport = list[dict]
 
@@ -14,25 +18,28 @@ console = Console()
 OUTPUT_BASE = Path("/data/sales/output")
 
 
-def _get_export_config() -> dict:
+@cache
+def _get_export_config() -> Mapping:
+    """Parse the export section of the domain config once per process (read-only)."""
     config_path = Path(__file__).parent / "config.toml"
     if config_path.exists():
         with open(config_path, "rb") as f:
             cfg = tomllib.load(f)
-        return cfg.get("export", {})
-    return {"format": "parquet", "partitioned": True}
+        return freeze_config(cfg.get("export", {}))
+    return freeze_config({"format": "parquet", "partitioned": True})
 
 
 def _write_partitioned(df: pd.DataFrame, path: Path, partition_col: str) -> int:
-    """Write a DataFrame partitioned by a column (hive-style)."""
-    rows_written = 0
-    for val in df[partition_col].unique():
-        partition_dir = path / f"{partition_col}={val}"
-        partition_dir.mkdir(parents=True, exist_ok=True)
-        subset = df[df[partition_col] == val]
-        subset.to_parquet(partition_dir / "data.parquet", index=False)
-        rows_written += len(subset)
-    return rows_written
+    """Write a DataFrame partitioned by a column (hive-style).
+
+    The parquet writer splits the frame into ``{partition_col}=<value>``
+    directories itself, so no per-partition subsets are materialized here.
+    The partition column is carried only by the directory names, and rows
+    with a null partition value are not written.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(path, index=False, partition_cols=[partition_col])
+    return int(df[partition_col].notna().sum())
 
 
 def _write_single(df: pd.DataFrame, path: Path, fmt: str) -> None:
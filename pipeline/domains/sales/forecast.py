@@ -30,23 +30,21 @@ def _compute_rolling_forecast(
     x = np.arange(len(valid))
     slope, intercept = np.polyfit(x, valid["rolling_avg"].values, 1)
 
-    # Generate forecast rows
+    # Generate forecast rows for the whole horizon at once
     last_period = valid["period"].iloc[-1]
-    forecast_rows = pd.DataFrame()
-    for i in range(1, FORECAST_HORIZON + 1):
-        projected = intercept + slope * (len(valid) + i)
-        row = pd.DataFrame([{
-            "period": last_period + pd.Timedelta(weeks=i),
-            "total_amount": None,
-            "rolling_avg": None,
-            "forecast": max(projected, 0),  # don't predict negative revenue
-            "is_forecast": True,
-        }])
-        forecast_rows = forecast_rows.append(row, ignore_index=True)
+    horizon = np.arange(1, FORECAST_HORIZON + 1)
+    projected = intercept + slope * (len(valid) + horizon)
+    forecast_rows = pd.DataFrame({
+        "period": last_period + pd.to_timedelta(horizon, unit="W"),
+        "total_amount": np.nan,
+        "rolling_avg": np.nan,
+        "forecast": np.maximum(projected, 0.0),  # don't predict negative revenue
+        "is_forecast": True,
+    })
 
     weekly["forecast"] = weekly["rolling_avg"]
     weekly["is_forecast"] = False
-    combined = weekly.append(forecast_rows, ignore_index=True)
+    combined = pd.concat([weekly, forecast_rows], ignore_index=True)
 
     return combined
 
@@ -76,7 +74,7 @@ def build_forecast(
 
     # Per-region forecasts if available
     if "region" in sales_df.columns:
-        regional_fc = pd.DataFrame()
+        regional_frames = []
         for region in sales_df["region"].unique():
             region_weekly = (
                 sales_df[sales_df["region"] == region]
@@ -89,9 +87,11 @@ def build_forecast(
             fc = _compute_rolling_forecast(region_weekly, window)
             if not fc.empty:
                 fc["region"] = region
-                regional_fc = regional_fc.append(fc, ignore_index=True)
+                regional_frames.append(fc)
 
-        results["by_region"] = regional_fc
+        results["by_region"] = (
+            pd.concat(regional_frames, ignore_index=True) if regional_frames else pd.DataFrame()
+        )
         console.print(f"  Regional forecasts: {sales_df['region'].nunique()} regions")
 
     return results
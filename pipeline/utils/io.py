@@ -1,7 +1,12 @@
 """File I/O utilities for reading and writing pipeline data."""
 
+import hashlib
+import os
+import tempfile
 import tomllib
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import pandas as pd
 from rich.console import Console
@@ -10,6 +15,8 @@ type FilePath = str | Path
 
 console = Console()
 
+CACHE_DIR = Path(tempfile.gettempdir()) / "pipeline_cache"
+
 
 def read_csv_files(directory: FilePath, pattern: str = "*.csv") -> pd.DataFrame:
     """Read all CSV files from a directory and concatenate them."""
@@ -68,7 +75,76 @@ def write_output(df: pd.DataFrame, path: FilePath, fmt: str = "csv") -> None:
     console.print(f"  Wrote {len(df)} rows to {path}")
 
 
+def _source_fingerprint(path: FilePath) -> str:
+    """Return a token that changes whenever the data behind `path` changes.
+
+    S3 objects are identified by their ETags, local files by size and mtime.
+    Prefixes and directories combine the tokens of every object under them.
+    """
+    path_str = str(path)
+    if path_str.startswith("s3://"):
+        import boto3
+
+        bucket, _, prefix = path_str.removeprefix("s3://").partition("/")
+        paginator = boto3.client("s3").get_paginator("list_objects_v2")
+        tokens = [
+            f"{obj['Key']}:{obj['ETag']}"
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix)
+            for obj in page.get("Contents", [])
+        ]
+        if not tokens:
+            raise FileNotFoundError(path_str)
+        return ",".join(tokens)
+
+    path = Path(path)
+    files = sorted(f for f in path.rglob("*") if f.is_file()) if path.is_dir() else [path]
+    return ",".join(f"{f}:{f.stat().st_size}:{f.stat().st_mtime_ns}" for f in files)
+
+
+def read_cached(path: FilePath, reader: Callable[..., pd.DataFrame], **kwargs) -> pd.DataFrame:
+    """Read `path` with `reader`, reusing a local Feather copy while the source is unchanged.
+
+    The cache key covers the source fingerprint and the reader arguments, so a
+    new upload or a different column selection always misses the cache.
+    """
+    fingerprint = _source_fingerprint(path)
+    key_material = f"{path}:{fingerprint}:{reader.__module__}.{reader.__name__}:{sorted(kwargs.items())!r}"
+    local = CACHE_DIR / f"{hashlib.sha1(key_material.encode()).hexdigest()}.feather"
+
+    if local.exists():
+        return pd.read_feather(local)
+
+    df = reader(path, **kwargs).reset_index(drop=True)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # stage to a file unique to this writer so concurrent readers of the same
+    # key never interleave writes before the atomic rename
+    fd, staging = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_feather(staging)
+        os.replace(staging, local)
+    except BaseException:
+        Path(staging).unlink(missing_ok=True)
+        raise
+    return df
+
+
 def load_toml_config(path: FilePath) -> dict:
     """Load a TOML configuration file using Python 3.11+ stdlib."""
     with open(path, "rb") as f:
         return tomllib.load(f)
+
+
+def freeze_config(value):
+    """Recursively convert a parsed config into read-only mappings and tuples.
+
+    Safe to share from a cached loader: no caller can mutate nested tables
+    or arrays and leak the change into later calls.
+    """
+    match value:
+        case Mapping():
+            return MappingProxyType({key: freeze_config(item) for key, item in value.items()})
+        case list() | tuple():
+            return tuple(freeze_config(item) for item in value)
+        case _:
+            return value